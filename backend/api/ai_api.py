@@ -1,6 +1,7 @@
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel, Field
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 import uuid
 
 # -----------------------------------
@@ -46,7 +47,7 @@ class TaxCalculationResponse(BaseModel):
 # Core Reasoning Engine (LLM wrapper)
 # -----------------------------------
 
-def run_reasoning_engine(question: str, context: Dict[str, Any]) -> dict:
+def _run_reasoning_engine(question: str, context: Dict[str, Any]) -> dict:
     """
     This is where your LLM or hybrid rules + AI logic lives.
     Replace with OpenAI / Azure / Local model calls.
@@ -75,12 +76,41 @@ def run_reasoning_engine(question: str, context: Dict[str, Any]) -> dict:
         "confidence": 0.81
     }
 
+@lru_cache(maxsize=256)
+def _cached_reasoning_engine(question: str, context_key: Tuple) -> dict:
+    return _run_reasoning_engine(
+        question, {key: value for key, _, value in context_key}
+    )
+
+def run_reasoning_engine(question: str, context: Dict[str, Any]) -> dict:
+    """
+    Run the reasoning engine, memoized per (question, context).
+
+    The key carries each value's type, so equal values of different
+    types (85000 / 85000.0 / True / 1) never share an entry. Contexts
+    with unhashable values are evaluated without the cache. Callers get
+    their own copy of the result, so mutating it never touches the
+    cached entry.
+    """
+    try:
+        context_key = tuple(
+            (key, type(value), value) for key, value in sorted(context.items())
+        )
+        hash(context_key)
+    except TypeError:
+        return _run_reasoning_engine(question, context)
+
+    result = _cached_reasoning_engine(question, context_key)
+    return {**result, "reasoning_steps": list(result["reasoning_steps"])}
+
+run_reasoning_engine.cache_info = _cached_reasoning_engine.cache_info
+
 # -----------------------------------
 # Endpoints
 # -----------------------------------
 
 @app.post("/reasoning", response_model=ReasoningResponse)
-def reasoning_endpoint(payload: ReasoningRequest):
+async def reasoning_endpoint(payload: ReasoningRequest):
     """
     General-purpose AI reasoning endpoint for tax questions.
     """
@@ -103,7 +133,7 @@ def reasoning_endpoint(payload: ReasoningRequest):
     )
 
 @app.post("/tax/calculate", response_model=TaxCalculationResponse)
-def calculate_tax(payload: TaxCalculationRequest):
+async def calculate_tax(payload: TaxCalculationRequest):
     """
     Deterministic tax calculation (non-AI).
     """
@@ -128,5 +158,5 @@ def calculate_tax(payload: TaxCalculationRequest):
     )
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
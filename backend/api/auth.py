@@ -10,6 +10,7 @@ from settings import (
     TOKEN_EXPIRATION_SECONDS,
     REQUIRE_AUTHENTICATION,
     ENVIRONMENT,
+    SECRET_KEY,
 )
 from exceptions import ValidationError, ComplianceError
 
@@ -18,7 +19,7 @@ from exceptions import ValidationError, ComplianceError
 # Security Constants
 # =====================
 
-JWT_SECRET = "CHANGE_ME_IN_PROD"  # must come from env in prod
+JWT_SECRET = SECRET_KEY
 JWT_ALGORITHM = "HS256"
 
 security = HTTPBearer()
@@ -1,6 +1,7 @@
 import os
 from enum import Enum
-from typing import Dict, Set
+from types import MappingProxyType
+from typing import Any, Dict, Final, Mapping, Set
 
 
 # =====================
@@ -27,6 +28,14 @@ def is_test() -> bool:
     return ENVIRONMENT == Environment.TEST
 
 
+# =====================
+# Core Settings
+# =====================
+
+TAX_YEAR: Final[int] = int(os.getenv("TAX_YEAR", 2024))
+AI_MODEL: Final[str] = os.getenv("AI_MODEL", "")
+
+
 # =====================
 # Feature Flags
 # =====================
@@ -141,6 +150,8 @@ MAX_ACCEPTABLE_RISK_LEVEL = os.getenv(
 REQUIRE_AUTHENTICATION = True
 REQUIRE_CONSENT_FOR_ADVICE = True
 
+SECRET_KEY: Final[str] = os.getenv("SECRET_KEY", "CHANGE_ME_IN_PROD")  # must come from env in prod
+
 TOKEN_EXPIRATION_SECONDS = int(
     os.getenv("TOKEN_EXPIRATION_SECONDS", 3600)
 )
@@ -155,3 +166,20 @@ if is_test():
     FEATURE_FLAGS["ENABLE_AGGRESSIVE_STRATEGIES"] = False
     ENABLE_REQUEST_LOGGING = False
 
+
+# =====================
+# Read-only Config View
+# =====================
+
+# Hot paths import the constants above directly; CONFIG is a read-only
+# view for callers that look settings up by name.
+CONFIG: Mapping[str, Any] = MappingProxyType({
+    "ENVIRONMENT": ENVIRONMENT.value,
+    "TAX_YEAR": TAX_YEAR,
+    "AI_MODEL": AI_MODEL,
+    "SECRET_KEY": SECRET_KEY,
+    "TOKEN_EXPIRATION_SECONDS": TOKEN_EXPIRATION_SECONDS,
+    "DEFAULT_JURISDICTION": DEFAULT_JURISDICTION,
+    "CONFIDENCE_THRESHOLD": CONFIDENCE_THRESHOLD,
+    "LOG_LEVEL": LOG_LEVEL,
+})
@@ -1,6 +1,6 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict
+from typing import Annotated, Optional, List, Dict
 from enum import Enum
 
 # -----------------------------------
@@ -51,6 +51,9 @@ FEDERAL_TAX_BRACKETS_2024 = {
     ],
 }
 
+# Most returns accepted by one /tax/calculate/batch request
+MAX_BATCH_SIZE = 1000
+
 # -----------------------------------
 # Request / Response Models
 # -----------------------------------
@@ -128,12 +131,7 @@ def calculate_progressive_tax(
 
     return tax_details
 
-# -----------------------------------
-# Endpoints
-# -----------------------------------
-
-@app.post("/tax/calculate", response_model=TaxCalculationResponse)
-def calculate_federal_tax(payload: TaxCalculationRequest):
+def _calculate(payload: TaxCalculationRequest) -> TaxCalculationResponse:
     if payload.tax_year != 2024:
         raise HTTPException(
             status_code=400,
@@ -188,7 +186,43 @@ def calculate_federal_tax(payload: TaxCalculationRequest):
         ),
     )
 
+# -----------------------------------
+# Endpoints
+# -----------------------------------
+
+@app.post("/tax/calculate", response_model=TaxCalculationResponse)
+async def calculate_federal_tax(payload: TaxCalculationRequest):
+    return _calculate(payload)
+
+@app.post("/tax/calculate/batch", response_model=List[TaxCalculationResponse])
+def calculate_federal_tax_batch(
+    payloads: Annotated[
+        List[TaxCalculationRequest], Body(max_length=MAX_BATCH_SIZE)
+    ],
+):
+    """
+    Calculate many returns in one request; results keep the input order.
+
+    Declared sync so FastAPI runs the calculation in its threadpool instead
+    of on the event loop. Every filing status is checked before any return
+    is calculated, so one unsupported status rejects the batch with a 422.
+    """
+    unsupported = [
+        i for i, payload in enumerate(payloads)
+        if payload.filing_status not in FEDERAL_TAX_BRACKETS_2024
+    ]
+    if unsupported:
+        raise HTTPException(
+            status_code=422,
+            detail=(
+                "No 2024 tax brackets for the filing status of "
+                f"returns at indexes {unsupported}"
+            ),
+        )
+
+    return [_calculate(payload) for payload in payloads]
+
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
 
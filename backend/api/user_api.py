@@ -67,7 +67,7 @@ def get_user_or_404(user_id: str) -> dict:
 # -----------------------------------
 
 @app.post("/users", response_model=UserProfile)
-def create_user(payload: UserCreateRequest):
+async def create_user(payload: UserCreateRequest):
     user_id = str(uuid4())
     now = datetime.utcnow()
 
@@ -87,11 +87,11 @@ def create_user(payload: UserCreateRequest):
     return user
 
 @app.get("/users/{user_id}", response_model=UserProfile)
-def get_user(user_id: str):
+async def get_user(user_id: str):
     return get_user_or_404(user_id)
 
 @app.put("/users/{user_id}", response_model=UserProfile)
-def update_user(user_id: str, payload: UserUpdateRequest):
+async def update_user(user_id: str, payload: UserUpdateRequest):
     user = get_user_or_404(user_id)
 
     update_data = payload.dict(exclude_unset=True)
@@ -105,11 +105,11 @@ def update_user(user_id: str, payload: UserUpdateRequest):
     return user
 
 @app.delete("/users/{user_id}")
-def delete_user(user_id: str):
+async def delete_user(user_id: str):
     get_user_or_404(user_id)
     del USER_STORE[user_id]
     return {"status": "deleted"}
 
 @app.get("/health")
-def health_check():
+async def health_check():
     return {"status": "ok"}
@@ -13,7 +13,7 @@ This module answers:
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, NamedTuple, Optional
 
 
 # -----------------------------
@@ -62,32 +62,38 @@ class RuleRoutingResult:
 # Rule registry (declarative)
 # -----------------------------
 
-RULE_REGISTRY = {
-    "STD_DEDUCTION": {
-        "description": "Standard Deduction",
-        "conditions": lambda ctx: True,
-        "confidence": 0.95,
-    },
-    "STUDENT_LOAN_INTEREST": {
-        "description": "Student Loan Interest Deduction",
-        "conditions": lambda ctx: ctx.has_student_loans,
-        "confidence": 0.75,
-    },
-    "MORTGAGE_INTEREST": {
-        "description": "Mortgage Interest Deduction",
-        "conditions": lambda ctx: ctx.has_mortgage,
-        "confidence": 0.8,
-    },
-    "SELF_EMPLOYMENT_TAX": {
-        "description": "Self-Employment Tax Rules",
-        "conditions": lambda ctx: ctx.has_self_employment_income,
-        "confidence": 0.9,
-    },
-    "CHILD_TAX_CREDIT": {
-        "description": "Child Tax Credit",
-        "conditions": lambda ctx: ctx.dependents > 0,
-        "confidence": 0.85,
-    },
+class RuleSpec(NamedTuple):
+    predicate: Callable[[TaxContext], bool]
+    description: str
+    confidence: float
+
+
+RULE_REGISTRY: Dict[str, RuleSpec] = {
+    "STD_DEDUCTION": RuleSpec(
+        predicate=lambda ctx: True,
+        description="Standard Deduction",
+        confidence=0.95,
+    ),
+    "STUDENT_LOAN_INTEREST": RuleSpec(
+        predicate=lambda ctx: ctx.has_student_loans,
+        description="Student Loan Interest Deduction",
+        confidence=0.75,
+    ),
+    "MORTGAGE_INTEREST": RuleSpec(
+        predicate=lambda ctx: ctx.has_mortgage,
+        description="Mortgage Interest Deduction",
+        confidence=0.8,
+    ),
+    "SELF_EMPLOYMENT_TAX": RuleSpec(
+        predicate=lambda ctx: ctx.has_self_employment_income,
+        description="Self-Employment Tax Rules",
+        confidence=0.9,
+    ),
+    "CHILD_TAX_CREDIT": RuleSpec(
+        predicate=lambda ctx: ctx.dependents > 0,
+        description="Child Tax Credit",
+        confidence=0.85,
+    ),
 }
 
 
@@ -104,9 +110,9 @@ def route_tax_rules(context: TaxContext) -> RuleRoutingResult:
     applicable: List[RuleMatch] = []
     excluded: Dict[str, str] = {}
 
-    for rule_id, rule in RULE_REGISTRY.items():
+    for rule_id, spec in RULE_REGISTRY.items():
         try:
-            applies = rule["conditions"](context)
+            applies = spec.predicate(context)
         except Exception as e:
             excluded[rule_id] = f"Condition evaluation failed: {e}"
             continue
@@ -115,9 +121,9 @@ def route_tax_rules(context: TaxContext) -> RuleRoutingResult:
             applicable.append(
                 RuleMatch(
                     rule_id=rule_id,
-                    description=rule["description"],
+                    description=spec.description,
                     reason_applied=_explain_reason(rule_id, context),
-                    confidence=rule["confidence"],
+                    confidence=spec.confidence,
                     requires_additional_validation=True,
                 )
             )
@@ -1,18 +1,109 @@
 # audit_trail.py
+import atexit
+import collections
 import logging
-from datetime import datetime
-from typing import Dict, Any
-
-# Configure logger
-logging.basicConfig(
-    filename="audit.log",
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
+import os
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+AUDIT_LOG_PATH = "audit.log"
+FLUSH_BACKLOG = 32768
+FLUSH_INTERVAL_SECONDS = 0.1
+
+logger = logging.getLogger("safety.audit_trail")
+
+# Pending events: (time_ns, level, user_id, action, details), with details
+# already rendered to text. The deque is unbounded so no record is ever
+# dropped; appends/poplefts are atomic in CPython, so callers never take a lock.
+_RING: "collections.deque[Tuple[int, str, str, str, str]]" = collections.deque()
+_WAKE = threading.Event()
+_WRITE_LOCK = threading.Lock()
+_AUDIT_FILE = open(AUDIT_LOG_PATH, "ab")
+
+# Formatted lines whose write failed; retried on the next flush.
+_UNWRITTEN: List[str] = []
+
+
+def _snapshot_details(details: Optional[Dict[str, Any]]) -> str:
+    # Render now, so mutating details after the call can't change the record
+    return f"{details or {}}"
+
+
+def _format_entry(entry: Tuple[int, str, str, str, str]) -> str:
+    """
+    Render one event in the "%(asctime)s [%(levelname)s] %(message)s" layout.
+    """
+    time_ns, level, user_id, action, details = entry
+    seconds, nanos = divmod(time_ns, 1_000_000_000)
+    asctime = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+    if level == "WARNING":
+        message = f"User: {user_id} | Warning: {action}"
+    else:
+        message = f"User: {user_id} | Action: {action} | Details: {details}"
+
+    return f"{asctime},{nanos // 1_000_000:03d} [{level}] {message}\n"
+
+
+def flush_now() -> None:
+    """
+    Drain every pending event to disk and fsync. Safe to call at shutdown.
+
+    If the write fails the lines stay queued and the error propagates;
+    the next flush retries them.
+    """
+    with _WRITE_LOCK:
+        while True:
+            try:
+                _UNWRITTEN.append(_format_entry(_RING.popleft()))
+            except IndexError:
+                break
+
+        if _UNWRITTEN:
+            _AUDIT_FILE.write("".join(_UNWRITTEN).encode("utf-8"))
+            _AUDIT_FILE.flush()
+            _UNWRITTEN.clear()
+            os.fsync(_AUDIT_FILE.fileno())
+
+
+def _flush_loop() -> None:
+    while True:
+        _WAKE.wait(FLUSH_INTERVAL_SECONDS)
+        _WAKE.clear()
+        try:
+            flush_now()
+        except Exception:
+            # Keep the flusher alive; unwritten lines are retried next pass
+            logger.exception("Audit trail flush failed")
+
+
+def _wake_if_backlogged() -> None:
+    # Wake the flusher early under bursts so memory stays bounded in practice.
+    if len(_RING) > FLUSH_BACKLOG:
+        _WAKE.set()
+
+
+def _enqueue(entry: Tuple[int, str, str, str, str]) -> None:
+    _RING.append(entry)
+    _wake_if_backlogged()
+
+
+_flusher = threading.Thread(
+    target=_flush_loop, name="audit-trail-flusher", daemon=True
 )
+_flusher.start()
+atexit.register(flush_now)
+
 
 class AuditTrail:
     """
     Logs all safety-related actions and changes for auditing.
+
+    Events are queued in memory and written by a background thread.
+    Details are rendered to text on the calling thread, so the record
+    reflects them at call time; timestamp formatting and disk I/O happen
+    on the flusher.
     """
 
     @staticmethod
@@ -20,12 +111,25 @@ class AuditTrail:
         """
         Log a single audit event.
         """
-        details = details or {}
-        logging.info(f"User: {user_id} | Action: {action} | Details: {details}")
-    
+        _enqueue((time.time_ns(), "INFO", user_id, action, _snapshot_details(details)))
+
+    @staticmethod
+    def log_event_batch(
+        events: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> None:
+        """
+        Log many (user_id, action, details) events with one timestamp.
+        """
+        now = time.time_ns()
+        _RING.extend([
+            (now, "INFO", user_id, action, _snapshot_details(details))
+            for user_id, action, details in events
+        ])
+        _wake_if_backlogged()
+
     @staticmethod
     def log_warning(user_id: str, warning: str) -> None:
         """
         Log a warning event.
         """
-        logging.warning(f"User: {user_id} | Warning: {warning}")
+        _enqueue((time.time_ns(), "WARNING", user_id, warning, ""))
@@ -10,14 +10,14 @@ It only validates correctness and legality of structure.
 """
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 
 # =====================================================
 # MODELS
 # =====================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ComplianceIssue:
     code: str
     message: str
@@ -30,6 +30,11 @@ class ComplianceResult:
     issues: List[ComplianceIssue]
 
 
+# Validators emit lightweight (code, message, severity) tuples;
+# ComplianceIssue objects are only built for the final result.
+IssueTuple = Tuple[str, str, str]
+
+
 # =====================================================
 # CONSTANTS (IRS CONSTRAINTS)
 # =====================================================
@@ -44,94 +49,82 @@ SE_INCOME_FACTOR = 0.9235
 # CORE VALIDATORS
 # =====================================================
 
-def validate_required_forms(forms: List[Dict]) -> List[ComplianceIssue]:
-    issues = []
+def validate_required_forms(forms: List[Dict]) -> List[IssueTuple]:
+    issues: List[IssueTuple] = []
 
     form_names = {f.get("Form") for f in forms}
 
     if "4562" in form_names and "Schedule C" not in form_names:
-        issues.append(
-            ComplianceIssue(
-                code="FORM_DEP_MISSING_SC",
-                message="Form 4562 present without Schedule C",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "FORM_DEP_MISSING_SC",
+            "Form 4562 present without Schedule C",
+            "ERROR",
+        ))
 
     if "Schedule SE" in form_names and "Schedule C" not in form_names:
-        issues.append(
-            ComplianceIssue(
-                code="FORM_SE_MISSING_SC",
-                message="Schedule SE requires Schedule C",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "FORM_SE_MISSING_SC",
+            "Schedule SE requires Schedule C",
+            "ERROR",
+        ))
 
     return issues
 
 
-def validate_section179(form_4562: Dict) -> List[ComplianceIssue]:
-    issues = []
+def validate_section179(form_4562: Dict) -> List[IssueTuple]:
+    issues: List[IssueTuple] = []
 
     sec179 = form_4562.get("Part I Section 179", 0)
 
     if sec179 < 0:
-        issues.append(
-            ComplianceIssue(
-                code="179_NEGATIVE",
-                message="Section 179 deduction cannot be negative",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "179_NEGATIVE",
+            "Section 179 deduction cannot be negative",
+            "ERROR",
+        ))
 
     if sec179 > SECTION_179_LIMIT:
-        issues.append(
-            ComplianceIssue(
-                code="179_LIMIT_EXCEEDED",
-                message="Section 179 exceeds IRS annual limit",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "179_LIMIT_EXCEEDED",
+            "Section 179 exceeds IRS annual limit",
+            "ERROR",
+        ))
 
     return issues
 
 
-def validate_bonus_depreciation(form_4562: Dict) -> List[ComplianceIssue]:
-    issues = []
+def validate_bonus_depreciation(form_4562: Dict) -> List[IssueTuple]:
+    issues: List[IssueTuple] = []
 
     bonus = form_4562.get("Part II Bonus Depreciation", 0)
 
     if bonus < 0:
-        issues.append(
-            ComplianceIssue(
-                code="BONUS_NEGATIVE",
-                message="Bonus depreciation cannot be negative",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "BONUS_NEGATIVE",
+            "Bonus depreciation cannot be negative",
+            "ERROR",
+        ))
 
     return issues
 
 
-def validate_schedule_c(schedule_c: Dict) -> List[ComplianceIssue]:
-    issues = []
+def validate_schedule_c(schedule_c: Dict) -> List[IssueTuple]:
+    issues: List[IssueTuple] = []
 
     net_profit = schedule_c.get("Net Profit", 0)
 
     if net_profit < 0:
-        issues.append(
-            ComplianceIssue(
-                code="SC_NEGATIVE_PROFIT",
-                message="Schedule C net loss detected (allowed, flagged)",
-                severity="INFO"
-            )
-        )
+        issues.append((
+            "SC_NEGATIVE_PROFIT",
+            "Schedule C net loss detected (allowed, flagged)",
+            "INFO",
+        ))
 
     return issues
 
 
-def validate_schedule_se(schedule_se: Dict, schedule_c: Dict) -> List[ComplianceIssue]:
-    issues = []
+def validate_schedule_se(schedule_se: Dict, schedule_c: Dict) -> List[IssueTuple]:
+    issues: List[IssueTuple] = []
 
     se_tax = schedule_se.get("Line 12", 0)
     net_profit = schedule_c.get("Net Profit", 0)
@@ -140,49 +133,41 @@ def validate_schedule_se(schedule_se: Dict, schedule_c: Dict) -> List[Compliance
     expected_tax = round(expected_base * SE_TAX_RATE, 2)
 
     if abs(se_tax - expected_tax) > 5:
-        issues.append(
-            ComplianceIssue(
-                code="SE_TAX_MISMATCH",
-                message="Schedule SE tax does not match Schedule C income",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "SE_TAX_MISMATCH",
+            "Schedule SE tax does not match Schedule C income",
+            "ERROR",
+        ))
 
     return issues
 
 
-def validate_1040(form_1040: Dict) -> List[ComplianceIssue]:
-    issues = []
+def validate_1040(form_1040: Dict) -> List[IssueTuple]:
+    issues: List[IssueTuple] = []
 
     total_income = form_1040.get("Line 9", 0)
     taxable_income = form_1040.get("Line 15", 0)
 
     if total_income < 0:
-        issues.append(
-            ComplianceIssue(
-                code="1040_NEG_INCOME",
-                message="Total income cannot be negative",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "1040_NEG_INCOME",
+            "Total income cannot be negative",
+            "ERROR",
+        ))
 
     if taxable_income < 0:
-        issues.append(
-            ComplianceIssue(
-                code="1040_NEG_TAXABLE",
-                message="Taxable income cannot be negative",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "1040_NEG_TAXABLE",
+            "Taxable income cannot be negative",
+            "ERROR",
+        ))
 
     if taxable_income > total_income:
-        issues.append(
-            ComplianceIssue(
-                code="1040_INVALID_TAXABLE",
-                message="Taxable income exceeds total income",
-                severity="ERROR"
-            )
-        )
+        issues.append((
+            "1040_INVALID_TAXABLE",
+            "Taxable income exceeds total income",
+            "ERROR",
+        ))
 
     return issues
 
@@ -192,7 +177,7 @@ def validate_1040(form_1040: Dict) -> List[ComplianceIssue]:
 # =====================================================
 
 def run_compliance_check(irs_return: Dict) -> ComplianceResult:
-    issues: List[ComplianceIssue] = []
+    issues: List[IssueTuple] = []
 
     forms = irs_return.get("Forms", [])
 
@@ -224,9 +209,9 @@ def run_compliance_check(irs_return: Dict) -> ComplianceResult:
     if "1040" in form_map:
         issues.extend(validate_1040(form_map["1040"]))
 
-    compliant = not any(i.severity == "ERROR" for i in issues)
+    compliant = not any(issue[2] == "ERROR" for issue in issues)
 
     return ComplianceResult(
         compliant=compliant,
-        issues=issues
+        issues=[ComplianceIssue(*issue) for issue in issues]
     )
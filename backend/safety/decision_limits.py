@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import ClassVar
 
 class ForbiddenAction(Enum):
     FINALIZE_FILING = "finalize_filing"
@@ -12,14 +13,15 @@ class DecisionLimits:
     Hard boundaries on what the AI system can do.
     """
 
-    def __init__(self):
-        self.forbidden = {action.value for action in ForbiddenAction}
+    FORBIDDEN: ClassVar[frozenset[str]] = frozenset(
+        action.value for action in ForbiddenAction
+    )
 
     def check(self, action: str) -> None:
-        if action in self.forbidden:
+        if action in self.FORBIDDEN:
             raise PermissionError(
                 f"Action '{action}' is not permitted by safety policy."
             )
 
-    def allowed_actions(self) -> set[str]:
-        return self.forbidden.copy()
+    def allowed_actions(self) -> frozenset[str]:
+        return self.FORBIDDEN
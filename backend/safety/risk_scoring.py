@@ -8,6 +8,7 @@ This module DOES NOT provide advice.
 It only evaluates risk signals.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
 from typing import Dict, List
 
@@ -16,7 +17,7 @@ from typing import Dict, List
 # MODELS
 # =====================================================
 
-@dataclass
+@dataclass(slots=True)
 class RiskFlag:
     code: str
     description: str
@@ -42,6 +43,14 @@ RISK_LEVELS = {
     "SEVERE": 75,
 }
 
+# Lower bound of each level above LOW, paired with the level names
+_LEVEL_THRESHOLDS = (
+    RISK_LEVELS["MODERATE"],
+    RISK_LEVELS["HIGH"],
+    RISK_LEVELS["SEVERE"],
+)
+_LEVEL_NAMES = ("LOW", "MODERATE", "HIGH", "SEVERE")
+
 
 # =====================================================
 # RISK RULE ENGINE
@@ -50,6 +59,7 @@ RISK_LEVELS = {
 class DeductionRiskEngine:
     def __init__(self):
         self.flags: List[RiskFlag] = []
+        self._running_total = 0
 
     def add_flag(
         self,
@@ -66,6 +76,7 @@ class DeductionRiskEngine:
                 score_impact=score_impact
             )
         )
+        self._running_total += score_impact
 
     # -------------------------------------------------
     # SECTION 179 / DEPRECIATION
@@ -161,16 +172,8 @@ class DeductionRiskEngine:
     # -------------------------------------------------
 
     def score(self) -> RiskScore:
-        total = min(100, sum(f.score_impact for f in self.flags))
-
-        if total < RISK_LEVELS["MODERATE"]:
-            level = "LOW"
-        elif total < RISK_LEVELS["HIGH"]:
-            level = "MODERATE"
-        elif total < RISK_LEVELS["SEVERE"]:
-            level = "HIGH"
-        else:
-            level = "SEVERE"
+        total = min(100, self._running_total)
+        level = _LEVEL_NAMES[bisect_right(_LEVEL_THRESHOLDS, total)]
 
         return RiskScore(
             total_score=total,
@@ -179,6 +182,50 @@ class DeductionRiskEngine:
         )
 
 
+# =====================================================
+# RULE TABLE
+# =====================================================
+
+# Only these forms are consulted; everything else is skipped while indexing
+_INTERESTING_FORMS = frozenset(("1040", "4562", "Schedule C"))
+
+# (required form or None, rule, argument extractor)
+# Extractors receive (forms, total_income, deductions, prior_year_deductions).
+_RULES = (
+    (
+        "4562",
+        DeductionRiskEngine.rule_high_section179,
+        lambda forms, income, deductions, prior: (forms["4562"], income),
+    ),
+    (
+        "4562",
+        DeductionRiskEngine.rule_bonus_heavy,
+        lambda forms, income, deductions, prior: (forms["4562"],),
+    ),
+    (
+        "Schedule C",
+        DeductionRiskEngine.rule_schedule_c_loss,
+        lambda forms, income, deductions, prior: (forms["Schedule C"],),
+    ),
+    (
+        "Schedule C",
+        DeductionRiskEngine.rule_round_number_income,
+        lambda forms, income, deductions, prior: (forms["Schedule C"],),
+    ),
+    (
+        None,
+        DeductionRiskEngine.rule_deductions_exceed_income,
+        lambda forms, income, deductions, prior: (income, deductions),
+    ),
+    (
+        # No-op when there is no prior-year figure (prior_year <= 0)
+        None,
+        DeductionRiskEngine.rule_large_year_over_year_change,
+        lambda forms, income, deductions, prior: (prior, deductions),
+    ),
+)
+
+
 # =====================================================
 # PUBLIC API
 # =====================================================
@@ -193,30 +240,23 @@ def run_risk_scoring(
 
     engine = DeductionRiskEngine()
 
-    forms = {f.get("Form"): f for f in irs_return.get("Forms", [])}
+    forms = {}
+    for f in irs_return.get("Forms", ()):
+        form_name = f.get("Form")
+        if form_name in _INTERESTING_FORMS:
+            forms[form_name] = f
 
     form_1040 = forms.get("1040", {})
-    form_4562 = forms.get("4562", {})
-    schedule_c = forms.get("Schedule C", {})
 
     total_income = form_1040.get("Line 9", 0)
     deductions = form_1040.get("Line 12", 0)
 
     # Apply rules
-    if form_4562:
-        engine.rule_high_section179(form_4562, total_income)
-        engine.rule_bonus_heavy(form_4562)
-
-    if schedule_c:
-        engine.rule_schedule_c_loss(schedule_c)
-        engine.rule_round_number_income(schedule_c)
-
-    engine.rule_deductions_exceed_income(total_income, deductions)
-
-    if prior_year_deductions:
-        engine.rule_large_year_over_year_change(
-            prior_year_deductions,
-            deductions
-        )
+    for form_key, rule, extract in _RULES:
+        if form_key is None or form_key in forms:
+            rule(
+                engine,
+                *extract(forms, total_income, deductions, prior_year_deductions)
+            )
 
     return engine.score()
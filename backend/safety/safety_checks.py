@@ -12,15 +12,21 @@ Design principles:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Dict, List
 import re
 
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; matching falls back to regex
+    ahocorasick = None
+
 
 # =====================================================
 # SAFETY MODELS
 # =====================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SafetyResult:
     allowed: bool
     reason: Optional[str] = None
@@ -66,70 +72,212 @@ REQUIRED_DISCLAIMER = (
     "and does not constitute legal or tax advice."
 )
 
+# Imperative phrasing rewritten to neutral educational framing
+SANITIZE_REPLACEMENTS = {
+    r"\byou should\b": "one common approach is",
+    r"\bI recommend\b": "the tax code allows",
+    r"\byour\b": "a taxpayer's",
+}
+
+
+def _compile_union(patterns: List[str], flags: int = re.IGNORECASE) -> re.Pattern:
+    """
+    Fuse a pattern list into one alternation so detection is a single scan.
+    """
+    return re.compile(
+        "|".join(f"(?:{p})" for p in patterns),
+        flags,
+    )
+
+
+def _lowered_pattern(pattern: str) -> str:
+    """
+    Lowercase a pattern's literal text, leaving escapes such as \\b intact.
+    """
+    return re.sub(
+        r"\\.|[^\\]+",
+        lambda m: m.group() if m.group().startswith("\\") else m.group().lower(),
+        pattern,
+    )
+
+
+def _compile_lowered_union(patterns: List[str]) -> re.Pattern:
+    """
+    Case-sensitive union of lowercased patterns, for use on text.lower().
+
+    Only equivalent to the re.IGNORECASE union on ASCII text; callers
+    must fall back to the folding union otherwise.
+    """
+    return _compile_union([_lowered_pattern(p) for p in patterns], 0)
+
+
+# A pattern of the form r"\bsome phrase\b" is a plain whole-word phrase
+_LITERAL_PHRASE_RE = re.compile(r"\\b(\w(?:[\w ]*\w)?)\\b")
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+class _PhraseMatcher:
+    """
+    Matches a pattern list in one pass over the text.
+
+    Whole-word literal phrases go into an Aho-Corasick automaton (when
+    pyahocorasick is installed); anything needing real regex syntax stays
+    in a compiled union. Non-ASCII text always uses the full regex union,
+    since str.lower() and re.IGNORECASE fold some characters differently.
+    ASCII text is lowercased once and matched case-sensitively.
+    """
+
+    def __init__(self, patterns: List[str]):
+        self.union = _compile_union(patterns)
+        self.lowered_union = _compile_lowered_union(patterns)
+        self.automaton = None
+        self.regex_union = None
+
+        if ahocorasick is None:
+            return
+
+        literals = []
+        regexes = []
+        for pattern in patterns:
+            match = _LITERAL_PHRASE_RE.fullmatch(pattern)
+            if match:
+                literals.append(match.group(1).lower())
+            else:
+                regexes.append(pattern)
+
+        if literals:
+            self.automaton = ahocorasick.Automaton()
+            for phrase in literals:
+                self.automaton.add_word(phrase, len(phrase))
+            self.automaton.make_automaton()
+
+        if regexes:
+            self.regex_union = _compile_lowered_union(regexes)
+
+    def search(self, text: str) -> bool:
+        if not text.isascii():
+            return self.union.search(text) is not None
+
+        lowered = text.lower()
+        if self.automaton is None:
+            return self.lowered_union.search(lowered) is not None
+
+        last = len(lowered) - 1
+        for end, length in self.automaton.iter(lowered):
+            start = end - length + 1
+            if (
+                (start == 0 or not _is_word_char(lowered[start - 1]))
+                and (end == last or not _is_word_char(lowered[end + 1]))
+            ):
+                return True
+
+        return (
+            self.regex_union is not None
+            and self.regex_union.search(lowered) is not None
+        )
+
+
+# Compiled once at import so every gate call goes straight to the C matcher
+_PROHIBITED_MATCHER = _PhraseMatcher(PROHIBITED_PATTERNS)
+_ALLOWED_CONTEXT_MATCHER = _PhraseMatcher(ALLOWED_CONTEXT_PATTERNS)
+_SANITIZE_UNION = _compile_union(list(SANITIZE_REPLACEMENTS))
+_SANITIZE_LOWERED_UNION = _compile_lowered_union(list(SANITIZE_REPLACEMENTS))
+_REPLACEMENTS = [
+    (re.compile(p, re.IGNORECASE), replacement)
+    for p, replacement in SANITIZE_REPLACEMENTS.items()
+]
+_LOWERED_REPLACEMENTS = [
+    (re.compile(_lowered_pattern(p)), replacement)
+    for p, replacement in SANITIZE_REPLACEMENTS.items()
+]
+_REQUIRED_DISCLAIMER_LOWER = REQUIRED_DISCLAIMER.lower()
+
+_SUPPORTED_JURISDICTION_KEYS = frozenset(SUPPORTED_JURISDICTIONS)
+
+# Context keys that make a request personalized
+_PERSONAL_KEYS = frozenset((
+    "ssn",
+    "taxpayer_id",
+    "exact_income",
+    "specific_deduction_amount",
+))
+
 
 # =====================================================
 # CORE SAFETY CHECKS
 # =====================================================
 
 def contains_prohibited_language(text: str) -> bool:
-    for pattern in PROHIBITED_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return _PROHIBITED_MATCHER.search(text)
 
 
 def contains_allowed_context(text: str) -> bool:
-    for pattern in ALLOWED_CONTEXT_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            return True
-    return False
+    return _ALLOWED_CONTEXT_MATCHER.search(text)
 
 
 def contains_required_disclaimer(text: str) -> bool:
-    return REQUIRED_DISCLAIMER.lower() in text.lower()
+    return _REQUIRED_DISCLAIMER_LOWER in text.lower()
 
 
 def check_jurisdiction(context: Dict) -> bool:
     """
     Ensures output only applies to supported jurisdictions
     """
-    jurisdiction = context.get("jurisdiction", "US")
-    return jurisdiction in SUPPORTED_JURISDICTIONS
+    return context.get("jurisdiction", "US") in _SUPPORTED_JURISDICTION_KEYS
 
 
 def is_personalized(context: Dict) -> bool:
     """
     Blocks personalized advice
     """
-    return any(
-        key in context
-        for key in [
-            "ssn",
-            "taxpayer_id",
-            "exact_income",
-            "specific_deduction_amount",
-        ]
-    )
+    return any(key in context for key in _PERSONAL_KEYS)
 
 
 # =====================================================
 # RESPONSE SANITIZER
 # =====================================================
 
+def _splice_matches(pattern: re.Pattern, replacement: str, text: str) -> str:
+    """
+    Replace matches found in text.lower() at the same spans of the
+    original text, so unmatched parts keep their casing. ASCII text only.
+    """
+    pieces = []
+    position = 0
+
+    for match in pattern.finditer(text.lower()):
+        start, end = match.span()
+        pieces.append(text[position:start])
+        pieces.append(replacement)
+        position = end
+
+    if not pieces:
+        return text
+
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
 def sanitize_response(text: str) -> str:
     """
     Removes imperative language and replaces it
     with neutral educational framing.
     """
-    replacements = {
-        r"\byou should\b": "one common approach is",
-        r"\bI recommend\b": "the tax code allows",
-        r"\byour\b": "a taxpayer's",
-    }
-
     sanitized = text
-    for pattern, replacement in replacements.items():
-        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+
+    if not sanitized.isascii():
+        # Non-ASCII case folding differs from str.lower(); use the folding regexes
+        if _SANITIZE_UNION.search(sanitized) is not None:
+            for pattern, replacement in _REPLACEMENTS:
+                sanitized = pattern.sub(replacement, sanitized)
+
+    # Already-neutral responses skip the rewrite passes entirely
+    elif _SANITIZE_LOWERED_UNION.search(sanitized.lower()) is not None:
+        for pattern, replacement in _LOWERED_REPLACEMENTS:
+            sanitized = _splice_matches(pattern, replacement, sanitized)
 
     if not contains_required_disclaimer(sanitized):
         sanitized += f"\n\n{REQUIRED_DISCLAIMER}"
@@ -141,18 +289,9 @@ def sanitize_response(text: str) -> str:
 # MASTER SAFETY GATE
 # =====================================================
 
-def safety_gate(
-    ai_response: str,
-    context: Optional[Dict] = None
-) -> SafetyResult:
-    """
-    Final gatekeeper for all AI-generated tax content.
-    """
-
-    context = context or {}
-
-    # 1. Jurisdiction enforcement
-    if not check_jurisdiction(context):
+def _evaluate_safety_gate(ai_response: str, context: Dict) -> SafetyResult:
+    # 1. Jurisdiction enforcement (inlined check_jurisdiction)
+    if context.get("jurisdiction", "US") not in _SUPPORTED_JURISDICTION_KEYS:
         return SafetyResult(
             allowed=False,
             reason="Unsupported tax jurisdiction."
@@ -184,3 +323,38 @@ def safety_gate(
         allowed=True,
         sanitized_response=ai_response
     )
+
+
+@lru_cache(maxsize=4096)
+def _cached_safety_gate(ai_response: str, jurisdiction) -> SafetyResult:
+    return _evaluate_safety_gate(ai_response, {"jurisdiction": jurisdiction})
+
+
+def safety_gate(
+    ai_response: str,
+    context: Optional[Dict] = None
+) -> SafetyResult:
+    """
+    Final gatekeeper for all AI-generated tax content.
+
+    Results are memoized per (response, jurisdiction), the only context
+    value _evaluate_safety_gate reads besides the personal keys. Personalized
+    contexts are never cached, so SSNs and incomes are not kept alive in
+    the cache; neither are unhashable jurisdictions.
+    """
+
+    context = context or {}
+
+    if is_personalized(context):
+        return _evaluate_safety_gate(ai_response, context)
+
+    jurisdiction = context.get("jurisdiction", "US")
+    try:
+        hash(jurisdiction)
+    except TypeError:
+        return _evaluate_safety_gate(ai_response, context)
+
+    return _cached_safety_gate(ai_response, jurisdiction)
+
+
+safety_gate.cache_info = _cached_safety_gate.cache_info
@@ -12,14 +12,17 @@ class SafetyOrchestrator:
         errors = []
 
         if not isinstance(financial_profile, dict):
-            errors.append("Financial profile must be a dictionary.")
+            return {
+                "valid": False,
+                "errors": ["Financial profile must be a dictionary."]
+            }
 
-        if "income" in financial_profile and financial_profile["income"] < 0:
+        # Single lookup per key; absent keys fall back to a passing value
+        if financial_profile.get("income", 0) < 0:
             errors.append("Income cannot be negative.")
 
-        if "deductions" in financial_profile:
-            if not isinstance(financial_profile["deductions"], dict):
-                errors.append("Deductions must be a dictionary.")
+        if not isinstance(financial_profile.get("deductions", {}), dict):
+            errors.append("Deductions must be a dictionary.")
 
         return {
             "valid": len(errors) == 0,
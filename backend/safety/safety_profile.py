@@ -2,11 +2,18 @@
 from typing import Dict, Any
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
 class SafetyProfile:
     """
     Represents a user or system safety profile with risk levels, permissions, and audit settings.
     """
 
+    __slots__ = ("user_id", "risk_level", "permissions", "metadata")
+
     def __init__(self, user_id: str, risk_level: str = "low", permissions: Dict[str, bool] = None):
         self.user_id = user_id
         self.risk_level = risk_level
@@ -41,6 +48,22 @@ class SafetyProfile:
     def save_to_json(self, file_path: str) -> None:
         """
         Save profile to JSON file.
+
+        With orjson installed the file is written by orjson: 2-space indent,
+        raw UTF-8 and orjson's float formatting. Otherwise the stdlib writes
+        it with a 4-space indent and ASCII escapes. Both load to the same data.
         """
+        if orjson is not None:
+            with open(file_path, "wb") as f:
+                f.write(orjson.dumps(
+                    self.to_dict(),
+                    option=(
+                        orjson.OPT_INDENT_2
+                        | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_SERIALIZE_NUMPY
+                    ),
+                ))
+            return
+
         with open(file_path, "w") as f:
             json.dump(self.to_dict(), f, indent=4)
@@ -1,12 +1,14 @@
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+import numpy as np
+
 
 # =====================================================
 # DATA MODELS
 # =====================================================
 
-@dataclass
+@dataclass(slots=True)
 class AuditFlag:
     code: str
     description: str
@@ -14,13 +16,61 @@ class AuditFlag:
     score_impact: int
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     total_score: int
     flags: List[AuditFlag]
     risk_level: str
 
 
+def _total(values: np.ndarray) -> float:
+    """
+    Left-to-right total, the order the rules used to sum over asset dicts.
+
+    np.sum adds pairwise, which rounds differently and can move a total
+    across a rule threshold.
+    """
+    return sum(values.tolist())
+
+
+@dataclass(slots=True)
+class Assets:
+    """
+    Struct-of-arrays view of an asset list: one contiguous column per field.
+    """
+    section179: np.ndarray
+    bonus: np.ndarray
+    cost: np.ndarray
+    schedule_len: np.ndarray
+    schedule_sums: np.ndarray
+
+    @classmethod
+    def from_dicts(cls, assets: List[Dict]) -> "Assets":
+        n = len(assets)
+        section179 = np.empty(n, dtype=np.float64)
+        bonus = np.empty(n, dtype=np.float64)
+        cost = np.empty(n, dtype=np.float64)
+        schedule_len = np.empty(n, dtype=np.int64)
+        schedule_sums = np.empty(n, dtype=np.float64)
+
+        for i, a in enumerate(assets):
+            schedule = a.get("schedule", [])
+            section179[i] = a.get("section179", 0)
+            bonus[i] = a.get("bonus", 0)
+            cost[i] = a.get("cost", 0)
+            schedule_len[i] = len(schedule)
+            schedule_sums[i] = sum(schedule)
+
+        return cls(section179, bonus, cost, schedule_len, schedule_sums)
+
+    def depreciation_total(self) -> float:
+        """
+        Schedule depreciation plus Section 179 and bonus, totalled per asset
+        and then across assets.
+        """
+        return _total(self.schedule_sums + self.section179 + self.bonus)
+
+
 # =====================================================
 # CORE RISK ENGINE
 # =====================================================
@@ -50,11 +100,10 @@ class AuditRiskEngine:
     # RULES — DEPRECIATION
     # =================================================
 
-    def rule_excessive_section179(self, assets: List[Dict]):
+    def rule_excessive_section179(self, assets: Assets):
         limit = self.config.get("section179_soft_limit", 1_000_000)
-        total_179 = sum(a.get("section179", 0) for a in assets)
 
-        if total_179 > limit:
+        if _total(assets.section179) > limit:
             self.add_flag(
                 code="DEP179_HIGH",
                 description="Section 179 deduction unusually high",
@@ -62,11 +111,10 @@ class AuditRiskEngine:
                 score_impact=20
             )
 
-    def rule_bonus_depreciation_heavy(self, assets: List[Dict]):
-        bonus_total = sum(a.get("bonus", 0) for a in assets)
-        cost_total = sum(a.get("cost", 0) for a in assets)
+    def rule_bonus_depreciation_heavy(self, assets: Assets):
+        cost_total = _total(assets.cost)
 
-        if cost_total > 0 and bonus_total / cost_total > 0.8:
+        if cost_total > 0 and _total(assets.bonus) / cost_total > 0.8:
             self.add_flag(
                 code="BONUS_HEAVY",
                 description="Bonus depreciation exceeds 80% of asset cost",
@@ -74,17 +122,14 @@ class AuditRiskEngine:
                 score_impact=15
             )
 
-    def rule_short_lived_assets(self, assets: List[Dict]):
-        for a in assets:
-            schedule = a.get("schedule", [])
-            if len(schedule) <= 3:
-                self.add_flag(
-                    code="SHORT_RECOVERY",
-                    description="High concentration of short recovery assets",
-                    severity=5,
-                    score_impact=10
-                )
-                break
+    def rule_short_lived_assets(self, assets: Assets):
+        if (assets.schedule_len <= 3).any():
+            self.add_flag(
+                code="SHORT_RECOVERY",
+                description="High concentration of short recovery assets",
+                severity=5,
+                score_impact=10
+            )
 
     # =================================================
     # RULES — CONSISTENCY / BEHAVIORAL
@@ -172,19 +217,15 @@ def run_audit(
 
     engine = AuditRiskEngine(config)
 
-    engine.rule_excessive_section179(federal_assets)
-    engine.rule_bonus_depreciation_heavy(federal_assets)
-    engine.rule_short_lived_assets(federal_assets)
+    federal = Assets.from_dicts(federal_assets)
+    state = Assets.from_dicts(state_assets)
 
-    federal_total = sum(
-        sum(a.get("schedule", [])) + a.get("section179", 0) + a.get("bonus", 0)
-        for a in federal_assets
-    )
+    engine.rule_excessive_section179(federal)
+    engine.rule_bonus_depreciation_heavy(federal)
+    engine.rule_short_lived_assets(federal)
 
-    state_total = sum(
-        sum(a.get("schedule", [])) + a.get("section179", 0) + a.get("bonus", 0)
-        for a in state_assets
-    )
+    federal_total = federal.depreciation_total()
+    state_total = state.depreciation_total()
 
     engine.rule_large_year_over_year_change(
         prior_year_depreciation,
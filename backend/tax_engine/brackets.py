@@ -6,7 +6,17 @@ A simple module for calculating progressive taxes.
 Each tax bracket applies only to the income portion within that bracket.
 """
 
-from typing import List, Tuple
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Callable, Dict, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the batch kernel then runs interpreted
+    njit = None
+    prange = range
 
 
 # Type alias for clarity
@@ -15,7 +25,7 @@ from typing import List, Tuple
 TaxBracket = Tuple[float | None, float]
 
 
-def calculate_progressive_tax(income: float, brackets: List[TaxBracket]) -> float:
+def calculate_progressive_tax(income: float, brackets: Sequence[TaxBracket]) -> float:
     """
     Calculate total tax owed using progressive tax brackets.
 
@@ -23,6 +33,9 @@ def calculate_progressive_tax(income: float, brackets: List[TaxBracket]) -> floa
     :param brackets: List of tax brackets (upper_limit, rate)
     :return: Total tax owed
     """
+    if brackets is DEFAULT_BRACKETS:
+        return tax_default(income)
+
     if income <= 0:
         return 0.0
 
@@ -42,7 +55,7 @@ def calculate_progressive_tax(income: float, brackets: List[TaxBracket]) -> floa
     return round(tax, 2)
 
 
-def calculate_effective_tax_rate(income: float, brackets: List[TaxBracket]) -> float:
+def calculate_effective_tax_rate(income: float, brackets: Sequence[TaxBracket]) -> float:
     """
     Calculate the effective tax rate.
 
@@ -57,13 +70,248 @@ def calculate_effective_tax_rate(income: float, brackets: List[TaxBracket]) -> f
     return round(tax / income, 4)
 
 
-# Example brackets (you can change these)
-DEFAULT_BRACKETS: List[TaxBracket] = [
+# Example brackets. A tuple, because the precomputed DEFAULT_* tables and
+# tax_default below are built from it at import; pass your own brackets
+# instead of changing these.
+DEFAULT_BRACKETS: Tuple[TaxBracket, ...] = (
     (10_000, 0.10),   # 10% up to 10,000
     (40_000, 0.20),   # 20% from 10,001–40,000
     (80_000, 0.30),   # 30% from 40,001–80,000
     (None, 0.40),     # 40% above 80,000
-]
+)
+
+
+
+# -----------------------------
+# Memoized calculation
+# -----------------------------
+
+# Bracket lists are unhashable, so cached calls refer to them by a key
+# handed out here. Registered lists must not be mutated afterwards.
+_BRACKETS_REGISTRY: Dict[int, Sequence[TaxBracket]] = {}
+
+
+def register_brackets(brackets: Sequence[TaxBracket]) -> int:
+    """
+    Register brackets for calculate_progressive_tax_cached.
+
+    :return: Key to pass as brackets_key
+    """
+    key = id(brackets)
+    _BRACKETS_REGISTRY[key] = brackets
+    return key
+
+
+DEFAULT_BRACKETS_KEY = register_brackets(DEFAULT_BRACKETS)
+
+
+@lru_cache(maxsize=8192)
+def calculate_progressive_tax_cached(income: float, brackets_key: int) -> float:
+    """
+    Memoized calculate_progressive_tax for workloads that repeat incomes.
+    Hit/miss statistics are available via .cache_info().
+
+    :param income: Total taxable income
+    :param brackets_key: Key returned by register_brackets
+    :return: Total tax owed
+    """
+    brackets = _BRACKETS_REGISTRY.get(brackets_key)
+    if brackets is None:
+        raise ValueError(f"Unregistered brackets key: {brackets_key}")
+
+    return calculate_progressive_tax(income, brackets)
+
+
+# -----------------------------
+# Batch (vectorized) calculation
+# -----------------------------
+
+def _bracket_arrays(brackets: Sequence[TaxBracket]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split brackets into (limits, rates) arrays; the open top limit is inf.
+    """
+    limits = np.array(
+        [np.inf if upper is None else upper for upper, _ in brackets],
+        dtype=np.float64,
+    )
+    rates = np.array([rate for _, rate in brackets], dtype=np.float64)
+    return limits, rates
+
+
+def _batch_tax(
+    incomes: np.ndarray, limits: np.ndarray, rates: np.ndarray
+) -> np.ndarray:
+    out = np.empty_like(incomes)
+
+    for i in prange(incomes.size):
+        income = incomes[i]
+        tax = 0.0
+
+        if income > 0:
+            previous_limit = 0.0
+            for j in range(limits.size):
+                if income <= limits[j]:
+                    tax += (income - previous_limit) * rates[j]
+                    break
+                tax += (limits[j] - previous_limit) * rates[j]
+                previous_limit = limits[j]
+
+        out[i] = tax
+
+    return out
+
+
+if njit is not None:
+    _batch_tax = njit(cache=True, parallel=True)(_batch_tax)
+
+# The kernel compiles on its first call (or loads from the numba cache)
+_DEFAULT_LIMITS, _DEFAULT_RATES = _bracket_arrays(DEFAULT_BRACKETS)
+
+
+def calculate_progressive_tax_array(
+    incomes: np.ndarray,
+    brackets: Sequence[TaxBracket] = DEFAULT_BRACKETS,
+) -> np.ndarray:
+    """
+    Vectorized calculate_progressive_tax over many taxpayers.
+
+    :param incomes: Array of taxable incomes
+    :param brackets: List of tax brackets (upper_limit, rate)
+    :return: Array of tax owed, rounded to cents (np.round may differ from
+             the scalar round() by a cent on exact half-cent amounts)
+    """
+    if brackets is DEFAULT_BRACKETS:
+        limits, rates = _DEFAULT_LIMITS, _DEFAULT_RATES
+    else:
+        limits, rates = _bracket_arrays(brackets)
+
+    incomes = np.ascontiguousarray(incomes, dtype=np.float64)
+    return np.round(_batch_tax(incomes, limits, rates), 2)
+
+
+
+# -----------------------------
+# Compiled (closed-form) brackets
+# -----------------------------
+
+class CompiledBrackets:
+    """
+    A bracket list preprocessed into the cumulative tax owed at each upper
+    limit, so a lookup is one binary search plus one multiply-add instead
+    of a walk over every bracket.
+    """
+
+    def __init__(self, brackets: Sequence[TaxBracket]):
+        starts = [0.0]
+        cum = [0.0]
+        finite_limits = []
+        tax = 0.0
+
+        for upper_limit, rate in brackets:
+            if upper_limit is None:
+                break
+            tax += (upper_limit - starts[-1]) * rate
+            finite_limits.append(upper_limit)
+            starts.append(upper_limit)
+            cum.append(tax)
+
+        rates = [rate for _, rate in brackets[:len(starts)]]
+        # Without an open-ended top bracket, income above the last limit
+        # is untaxed: pad with a zero rate so the lookup needs no branch.
+        rates += [0.0] * (len(starts) - len(rates))
+
+        self._limits = tuple(finite_limits)
+        self._starts = tuple(starts)
+        self._rates = tuple(rates)
+        self._cum = tuple(cum)
+
+        self.limits = np.array(finite_limits, dtype=np.float64)
+        self.starts = np.array(starts, dtype=np.float64)
+        self.rates = np.array(rates, dtype=np.float64)
+        self.cum = np.array(cum, dtype=np.float64)
+
+    def tax(self, income: float) -> float:
+        """
+        Tax owed on a single income, rounded to cents.
+        """
+        if income <= 0:
+            return 0.0
+
+        i = bisect_left(self._limits, income)
+        return round(self._cum[i] + (income - self._starts[i]) * self._rates[i], 2)
+
+    def tax_array(self, incomes: np.ndarray) -> np.ndarray:
+        """
+        Tax owed on each income in an array, rounded to cents with np.round.
+        """
+        incomes = np.asarray(incomes, dtype=np.float64)
+        i = np.searchsorted(self.limits, incomes, side="left")
+        tax = self.cum[i] + (incomes - self.starts[i]) * self.rates[i]
+        return np.round(np.where(incomes > 0, tax, 0.0), 2)
+
+
+DEFAULT_COMPILED_BRACKETS = CompiledBrackets(DEFAULT_BRACKETS)
+
+
+def brackets_to_arrays(
+    brackets: Sequence[TaxBracket],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bracket arrays for searchsorted lookups: (edges, rates, cum).
+
+    Bracket i taxes income above edges[i] at rates[i], and cum[i] is the
+    tax owed on income up to edges[i]. For income > 0 the bracket index is
+    np.searchsorted(edges, income, side="left") - 1.
+    """
+    if brackets is DEFAULT_BRACKETS:
+        compiled = DEFAULT_COMPILED_BRACKETS
+    else:
+        compiled = CompiledBrackets(brackets)
+
+    return compiled.starts, compiled.rates, compiled.cum
+
+
+DEFAULT_BRACKET_ARRAYS = brackets_to_arrays(DEFAULT_BRACKETS)
+
+
+# -----------------------------
+# Specialized tax functions
+# -----------------------------
+
+def _compile_brackets(brackets: Sequence[TaxBracket]) -> Callable[[float], float]:
+    """
+    Generate a tax function with the bracket constants inlined as an
+    if-ladder, so a call does no list iteration or tuple unpacking.
+
+    Constants are emitted with repr() so the generated arithmetic is
+    identical to calculate_progressive_tax.
+    """
+    compiled = CompiledBrackets(brackets)
+    lines = [
+        "def tax(income):",
+        "    if income <= 0:",
+        "        return 0.0",
+    ]
+
+    for limit, start, rate, cum in zip(
+        compiled._limits, compiled._starts, compiled._rates, compiled._cum
+    ):
+        lines.append(f"    if income <= {limit!r}:")
+        lines.append(
+            f"        return round({cum!r} + (income - {start!r}) * {rate!r}, 2)"
+        )
+
+    lines.append(
+        f"    return round({compiled._cum[-1]!r} + "
+        f"(income - {compiled._starts[-1]!r}) * {compiled._rates[-1]!r}, 2)"
+    )
+
+    namespace: Dict[str, Callable[[float], float]] = {}
+    exec("\n".join(lines), {"round": round}, namespace)
+    return namespace["tax"]
+
+
+tax_default = _compile_brackets(DEFAULT_BRACKETS)
 
 
 if __name__ == "__main__":
@@ -36,7 +36,7 @@ QBI_INCOME_LIMITS = {
 # Business Expenses
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BusinessExpenses:
     advertising: float = 0.0
     office_expenses: float = 0.0
@@ -52,7 +52,17 @@ class BusinessExpenses:
 
     def total(self) -> float:
         return round(
-            sum(max(0.0, v) for v in self.__dict__.values()),
+            max(0.0, self.advertising)
+            + max(0.0, self.office_expenses)
+            + max(0.0, self.supplies)
+            + max(0.0, self.meals)
+            + max(0.0, self.travel)
+            + max(0.0, self.vehicle)
+            + max(0.0, self.home_office)
+            + max(0.0, self.insurance)
+            + max(0.0, self.professional_fees)
+            + max(0.0, self.depreciation)
+            + max(0.0, self.other),
             2,
         )
 
@@ -61,7 +71,7 @@ class BusinessExpenses:
 # Schedule C
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScheduleC:
     business_name: str
     gross_receipts: float
@@ -75,11 +85,15 @@ def calculate_schedule_c(schedule: ScheduleC) -> Dict[str, float]:
     if schedule.gross_receipts < 0:
         raise ValueError("Gross receipts cannot be negative")
 
+    # Same as schedule.net_profit(), without totalling expenses twice
+    total_expenses = schedule.expenses.total()
+    net_profit = round(schedule.gross_receipts - total_expenses, 2)
+
     return {
         "business_name": schedule.business_name,
         "gross_receipts": round(schedule.gross_receipts, 2),
-        "total_expenses": schedule.expenses.total(),
-        "net_profit": schedule.net_profit(),
+        "total_expenses": total_expenses,
+        "net_profit": net_profit,
     }
 
 
@@ -5,11 +5,18 @@ Handles common tax credits such as:
 - Child Tax Credit (CTC)
 - Earned Income Tax Credit (EITC)
 
-Designed to be configurable and easy to update as rules change.
+The rule tables are read-only: the per-status CTC functions and the batch
+arrays are generated from them at import, so rule changes are made here in
+the source.
 """
 
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Callable, Dict, Tuple, Union
+
+import numpy as np
+
+from filing_status import FilingStatus, FILING_STATUS_NAMES, to_filing_status
 
 
 # -----------------------------
@@ -19,18 +26,21 @@ from typing import Dict
 CTC_PER_CHILD = 2000
 CTC_REFUNDABLE_LIMIT = 1600
 
-CTC_PHASEOUT_THRESHOLDS = {
+CTC_PHASEOUT_THRESHOLDS = MappingProxyType({
     "single": 200_000,
     "head_of_household": 200_000,
     "married_joint": 400_000,
     "married_separate": 200_000,
-}
+})
+
+# CTC_PHASEOUT_THRESHOLDS indexed by FilingStatus
+_CTC_THRESHOLDS = tuple(CTC_PHASEOUT_THRESHOLDS[name] for name in FILING_STATUS_NAMES)
 
 CTC_PHASEOUT_RATE = 0.05  # $50 per $1,000 over threshold
 
 
 def calculate_child_tax_credit(
-    filing_status: str,
+    filing_status: Union[FilingStatus, str],
     agi: float,
     qualifying_children: int,
 ) -> Dict[str, float]:
@@ -42,33 +52,53 @@ def calculate_child_tax_credit(
     if qualifying_children <= 0:
         return {"total": 0.0, "refundable": 0.0, "nonrefundable": 0.0}
 
-    max_credit = qualifying_children * CTC_PER_CHILD
-    threshold = CTC_PHASEOUT_THRESHOLDS.get(filing_status)
-
-    if threshold is None:
-        raise ValueError(f"Invalid filing status: {filing_status}")
-
-    # Phaseout calculation
-    if agi > threshold:
-        excess = agi - threshold
-        reduction = (excess // 1000) * (CTC_PHASEOUT_RATE * 1000)
-        max_credit = max(0.0, max_credit - reduction)
-
-    refundable = min(max_credit, qualifying_children * CTC_REFUNDABLE_LIMIT)
-    nonrefundable = max_credit - refundable
+    total, refundable, nonrefundable = _CTC_BY_STATUS[
+        to_filing_status(filing_status)
+    ](agi, qualifying_children)
 
     return {
-        "total": round(max_credit, 2),
-        "refundable": round(refundable, 2),
-        "nonrefundable": round(nonrefundable, 2),
+        "total": total,
+        "refundable": refundable,
+        "nonrefundable": nonrefundable,
     }
 
 
+def _compile_ctc(threshold: float) -> Callable[[float, int], Tuple[float, float, float]]:
+    """
+    Generate the CTC (total, refundable, nonrefundable) calculation for one
+    phaseout threshold, with every constant inlined as a literal.
+    """
+    source = "\n".join([
+        "def ctc(agi, children):",
+        f"    max_credit = children * {CTC_PER_CHILD!r}",
+        "",
+        "    # Phaseout calculation",
+        f"    if agi > {threshold!r}:",
+        f"        reduction = ((agi - {threshold!r}) // 1000) * {CTC_PHASEOUT_RATE * 1000!r}",
+        "        max_credit = max(0.0, max_credit - reduction)",
+        "",
+        f"    refundable = min(max_credit, children * {CTC_REFUNDABLE_LIMIT!r})",
+        "    return (",
+        "        round(max_credit, 2),",
+        "        round(refundable, 2),",
+        "        round(max_credit - refundable, 2),",
+        "    )",
+    ])
+
+    namespace: Dict[str, Callable] = {}
+    exec(source, {}, namespace)
+    return namespace["ctc"]
+
+
+# One generated CTC function per filing status, indexed by FilingStatus
+_CTC_BY_STATUS = tuple(_compile_ctc(threshold) for threshold in _CTC_THRESHOLDS)
+
+
 # -----------------------------
 # Earned Income Tax Credit (EITC)
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EITCRule:
     max_credit: float
     phase_in_rate: float
@@ -76,12 +106,19 @@ class EITCRule:
     phase_out_start: float
 
 
-EITC_RULES = {
+EITC_RULES = MappingProxyType({
     0: EITCRule(600, 0.0765, 0.0765, 9_800),
     1: EITCRule(3995, 0.34, 0.1598, 21_560),
     2: EITCRule(6604, 0.40, 0.2106, 21_560),
     3: EITCRule(7430, 0.45, 0.2106, 21_560),
-}
+})
+
+# EITC_RULES as plain tuples indexed by min(children, 3):
+# (max_credit, phase_in_rate, phase_out_rate, phase_out_start)
+_EITC = tuple(
+    (rule.max_credit, rule.phase_in_rate, rule.phase_out_rate, rule.phase_out_start)
+    for rule in (EITC_RULES[k] for k in range(len(EITC_RULES)))
+)
 
 
 def calculate_eitc(
@@ -95,16 +132,19 @@ def calculate_eitc(
     :return: EITC amount
     """
     children = min(qualifying_children, 3)
-    rule = EITC_RULES[children]
+    if children < 0:
+        raise ValueError("Qualifying children cannot be negative")
+
+    max_credit, phase_in_rate, phase_out_rate, phase_out_start = _EITC[children]
 
     income = min(earned_income, agi)
 
     # Phase-in
-    credit = min(rule.max_credit, income * rule.phase_in_rate)
+    credit = min(max_credit, income * phase_in_rate)
 
     # Phase-out
-    if income > rule.phase_out_start:
-        reduction = (income - rule.phase_out_start) * rule.phase_out_rate
+    if income > phase_out_start:
+        reduction = (income - phase_out_start) * phase_out_rate
         credit = max(0.0, credit - reduction)
 
     return round(credit, 2)
@@ -115,7 +155,7 @@ def calculate_eitc(
 # -----------------------------
 
 def calculate_total_credits(
-    filing_status: str,
+    filing_status: Union[FilingStatus, str],
     agi: float,
     earned_income: float,
     qualifying_children: int,
@@ -146,6 +186,83 @@ def calculate_total_credits(
     }
 
 
+# -----------------------------
+# Batch Credits
+# -----------------------------
+
+_CTC_THRESHOLDS_ARR = np.array(_CTC_THRESHOLDS, dtype=np.float64)
+
+# _EITC columns, indexed by min(children, 3)
+(
+    _EITC_MAX_CREDIT,
+    _EITC_PHASE_IN_RATE,
+    _EITC_PHASE_OUT_RATE,
+    _EITC_PHASE_OUT_START,
+) = (np.array(column, dtype=np.float64) for column in zip(*_EITC))
+
+CREDITS_BATCH_DTYPE = np.dtype([
+    ("ctc_total", np.float64),
+    ("ctc_refundable", np.float64),
+    ("ctc_nonrefundable", np.float64),
+    ("eitc", np.float64),
+    ("total_credits", np.float64),
+])
+
+
+def calculate_credits_batch(
+    statuses: np.ndarray,
+    agi: np.ndarray,
+    earned_income: np.ndarray,
+    qualifying_children: np.ndarray,
+) -> np.ndarray:
+    """
+    Vectorized calculate_total_credits over parallel arrays of taxpayers.
+
+    :param statuses: FilingStatus codes (integers)
+    :return: Structured array with CREDITS_BATCH_DTYPE fields, one row per
+             taxpayer. Amounts are rounded with np.round, which can differ
+             from round() by a cent on exact half-cent values.
+    """
+    statuses = np.asarray(statuses, dtype=np.intp)
+    agi = np.asarray(agi, dtype=np.float64)
+    earned_income = np.asarray(earned_income, dtype=np.float64)
+    kids = np.asarray(qualifying_children, dtype=np.int64)
+
+    if statuses.size and (statuses.min() < 0 or statuses.max() >= len(FilingStatus)):
+        raise ValueError("Invalid filing status code")
+    if kids.size and kids.min() < 0:
+        raise ValueError("Qualifying children cannot be negative")
+
+    # Child Tax Credit
+    threshold = _CTC_THRESHOLDS_ARR[statuses]
+    max_credit = kids * float(CTC_PER_CHILD)
+    reduction = ((agi - threshold) // 1000) * (CTC_PHASEOUT_RATE * 1000)
+    max_credit = np.where(
+        agi > threshold, np.maximum(0.0, max_credit - reduction), max_credit
+    )
+    refundable = np.minimum(max_credit, kids * float(CTC_REFUNDABLE_LIMIT))
+    nonrefundable = max_credit - refundable
+
+    # Earned Income Tax Credit
+    rule = np.minimum(kids, 3)
+    start = _EITC_PHASE_OUT_START[rule]
+    income = np.minimum(earned_income, agi)
+    eitc = np.minimum(_EITC_MAX_CREDIT[rule], income * _EITC_PHASE_IN_RATE[rule])
+    eitc = np.where(
+        income > start,
+        np.maximum(0.0, eitc - (income - start) * _EITC_PHASE_OUT_RATE[rule]),
+        eitc,
+    )
+
+    out = np.empty(statuses.shape, dtype=CREDITS_BATCH_DTYPE)
+    out["ctc_total"] = np.round(max_credit, 2)
+    out["ctc_refundable"] = np.round(refundable, 2)
+    out["ctc_nonrefundable"] = np.round(nonrefundable, 2)
+    out["eitc"] = np.round(eitc, 2)
+    out["total_credits"] = np.round(out["ctc_total"] + out["eitc"], 2)
+    return out
+
+
 # -----------------------------
 # Example Usage
 # -----------------------------
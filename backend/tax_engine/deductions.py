@@ -5,41 +5,46 @@ Handles standard and itemized deduction calculations with validation.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Optional, Union
+
+from filing_status import FilingStatus, FILING_STATUS_NAMES, to_filing_status
 
 
 # -----------------------------
 # Standard Deduction Rules
 # -----------------------------
 
-STANDARD_DEDUCTIONS = {
+# Read-only, because the indexed table and cache below are built from it
+# at import; change the amounts here in the source.
+STANDARD_DEDUCTIONS = MappingProxyType({
     "single": 13850,
     "married_joint": 27700,
     "married_separate": 13850,
     "head_of_household": 20800,
-}
+})
+
+# STANDARD_DEDUCTIONS indexed by FilingStatus
+_STD_DEDUCTION = tuple(STANDARD_DEDUCTIONS[name] for name in FILING_STATUS_NAMES)
 
 
-def get_standard_deduction(filing_status: str) -> float:
+@lru_cache(maxsize=256, typed=True)
+def get_standard_deduction(filing_status: Union[FilingStatus, str]) -> float:
     """
     Return the standard deduction based on filing status.
 
-    :param filing_status: Filing status string
+    :param filing_status: FilingStatus or filing status string
     :return: Standard deduction amount
     """
-    filing_status = filing_status.lower()
-
-    if filing_status not in STANDARD_DEDUCTIONS:
-        raise ValueError(f"Invalid filing status: {filing_status}")
-
-    return STANDARD_DEDUCTIONS[filing_status]
+    return _STD_DEDUCTION[to_filing_status(filing_status)]
 
 
 # -----------------------------
 # Itemized Deductions
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ItemizedDeductions:
     """
     Represents itemized deductions.
@@ -102,3 +107,16 @@ def calculate_best_deduction(
     :param adjusted_gross_income: AGI
     :param itemized: Optional itemized deductions
     :return: Dict with deduction type and amount
+    """
+    standard = get_standard_deduction(filing_status)
+
+    itemized_total = (
+        calculate_itemized_deductions(itemized, adjusted_gross_income)
+        if itemized
+        else 0.0
+    )
+
+    if itemized_total > standard:
+        return {"deduction_type": "itemized", "deduction_amount": itemized_total}
+
+    return {"deduction_type": "standard", "deduction_amount": standard}
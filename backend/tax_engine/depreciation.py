@@ -1,7 +1,15 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 import json
 
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the asset kernel then runs interpreted
+    njit = None
+    prange = range
+
 
 # =====================================================
 # CONFIG LOADING
@@ -31,12 +39,56 @@ MACRS_GDS_HALF_YEAR = {
          0.0446, 0.0446, 0.0446, 0.0446, 0.0223],
 }
 
+# =====================================================
+# INTEGER-CENTS ARITHMETIC
+# =====================================================
+
+# Amounts are computed in integer cents and rates in integer millionths,
+# so every schedule sums exactly and is rounded (half up) once per value.
+# Exact up to bases of about $10 billion.
+RATE_SCALE = 1_000_000
+_HALF_RATE = RATE_SCALE // 2
+
+
+def _to_cents(amount: float) -> int:
+    return round(amount * 100)
+
+
+def _to_rate_units(rate: float) -> int:
+    return round(rate * RATE_SCALE)
+
+
+def _apply_rate(cents: int, rate_units: int) -> int:
+    return (cents * rate_units + _HALF_RATE) // RATE_SCALE
+
+
+# All MACRS tables as rate units in one contiguous int64 block: row p
+# holds the rates for period p, zero-padded past _MACRS_RATE_LENGTHS[p]
+_MACRS_RATE_TABLE = np.zeros(
+    (max(MACRS_GDS_HALF_YEAR) + 1, max(len(r) for r in MACRS_GDS_HALF_YEAR.values())),
+    dtype=np.int64,
+)
+_MACRS_RATE_LENGTHS = np.zeros(max(MACRS_GDS_HALF_YEAR) + 1, dtype=np.int64)
+for _period, _rates in MACRS_GDS_HALF_YEAR.items():
+    _MACRS_RATE_TABLE[_period, :len(_rates)] = [_to_rate_units(r) for r in _rates]
+    _MACRS_RATE_LENGTHS[_period] = len(_rates)
+_MACRS_RATE_TABLE.flags.writeable = False
+
+# Per-period views into _MACRS_RATE_TABLE (no copies)
+_MACRS_RATES: Dict[int, np.ndarray] = {
+    period: _MACRS_RATE_TABLE[period, :len(rates)]
+    for period, rates in MACRS_GDS_HALF_YEAR.items()
+}
+
+# Placeholder rate table for ADS assets, which don't use MACRS rates
+_NO_RATES = np.empty(0, dtype=np.int64)
+
 
 # =====================================================
 # DATA MODELS
 # =====================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DepreciableAsset:
     cost: float
     recovery_period: int
@@ -46,9 +98,33 @@ class DepreciableAsset:
     state_override: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AssetPool:
-    assets: List[DepreciableAsset]
+    assets: Tuple[DepreciableAsset, ...]
+
+    def __post_init__(self):
+        # Accept any sequence, but store an immutable tuple
+        object.__setattr__(self, "assets", tuple(self.assets))
+
+
+@dataclass(slots=True, frozen=True)
+class DepreciationResult:
+    cost: float
+    section179: float
+    bonus: float
+    remaining_basis: float
+    schedule: List[float]
+    total_depreciation: float
+
+    def to_dict(self) -> Dict:
+        return {
+            "cost": self.cost,
+            "section179": self.section179,
+            "bonus": self.bonus,
+            "remaining_basis": self.remaining_basis,
+            "schedule": self.schedule,
+            "total_depreciation": self.total_depreciation,
+        }
 
 
 # =====================================================
@@ -56,7 +132,7 @@ class AssetPool:
 # =====================================================
 
 def apply_section179(cost: float, elected: float) -> float:
-    return round(cost - min(cost, elected), 2)
+    return (_to_cents(cost) - _to_cents(min(cost, elected))) / 100
 
 
 # =====================================================
@@ -64,16 +140,20 @@ def apply_section179(cost: float, elected: float) -> float:
 # =====================================================
 
 def bonus_depreciation(basis: float, rate: float) -> float:
-    return round(basis * rate, 2)
+    return _apply_rate(_to_cents(basis), _to_rate_units(rate)) / 100
 
 
 # =====================================================
 # MID-QUARTER TEST
 # =====================================================
 
-def requires_mid_quarter(assets: List[DepreciableAsset]) -> bool:
-    total = sum(a.cost for a in assets)
-    q4 = sum(a.cost for a in assets if a.placed_in_service_qtr == 4)
+def requires_mid_quarter(assets: Sequence[DepreciableAsset]) -> bool:
+    total = q4 = 0.0
+    for a in assets:
+        cost = a.cost
+        total += cost
+        if a.placed_in_service_qtr == 4:
+            q4 += cost
     return q4 / total > 0.40 if total else False
 
 
@@ -81,88 +161,288 @@ def requires_mid_quarter(assets: List[DepreciableAsset]) -> bool:
 # ADS (STRAIGHT-LINE)
 # =====================================================
 
-def ads_schedule(basis: float, recovery_period: int) -> List[float]:
-    annual = round(basis / recovery_period, 2)
-    schedule = [annual] * recovery_period
-    schedule[-1] += round(basis - sum(schedule), 2)
+def _ads_cents(basis: int, recovery_period: int) -> np.ndarray:
+    # Straight-line in cents, rounded half up; the last year takes the remainder
+    annual = (2 * basis + recovery_period) // (2 * recovery_period)
+    schedule = np.full(recovery_period, annual, dtype=np.int64)
+    # Every year is equal, so the remainder needs no pass over the schedule
+    schedule[-1] += basis - annual * recovery_period
     return schedule
 
 
+def ads_schedule(basis: float, recovery_period: int) -> List[float]:
+    return (_ads_cents(_to_cents(basis), recovery_period) / 100).tolist()
+
+
 # =====================================================
 # MACRS SCHEDULE
 # =====================================================
 
-def macrs_schedule(basis: float, recovery_period: int) -> List[float]:
-    rates = MACRS_GDS_HALF_YEAR[recovery_period]
-    schedule = [round(basis * r, 2) for r in rates]
-    schedule[-1] += round(basis - sum(schedule), 2)
+def _macrs_cents(basis: int, rates: np.ndarray) -> np.ndarray:
+    # Each year rounded half up to the cent; the last year takes the remainder
+    schedule = (rates * basis + _HALF_RATE) // RATE_SCALE
+    schedule[-1] += basis - schedule.sum()
     return schedule
 
 
+def macrs_schedule(basis: float, recovery_period: int) -> List[float]:
+    """
+    Yearly MACRS deductions, computed in integer cents in one vectorized
+    pass. The schedule always totals the basis exactly.
+    """
+    rates = _MACRS_RATES[recovery_period]
+    return (_macrs_cents(_to_cents(basis), rates) / 100).tolist()
+
+
 # =====================================================
 # FULL ASSET DEPRECIATION
 # =====================================================
 
+def _depreciate_asset_kernel(
+    cost: int,
+    elected: int,
+    bonus_rate: int,
+    recovery_period: int,
+    rates: np.ndarray,
+    use_ads: bool
+):
+    """
+    Section 179, bonus and schedule for one asset, in integer cents.
+
+    Takes rates in RATE_SCALE units and returns (section179, bonus,
+    remaining_basis, schedule, total) in cents. Mirrors apply_section179,
+    bonus_depreciation, macrs_schedule and ads_schedule.
+    """
+    if recovery_period <= 0:
+        raise ZeroDivisionError("recovery period must be positive")
+
+    section179 = min(cost, elected)
+    basis = cost - section179
+
+    bonus = (basis * bonus_rate + _HALF_RATE) // RATE_SCALE
+    basis -= bonus
+
+    if use_ads:
+        schedule = _ads_cents(basis, recovery_period)
+    else:
+        schedule = _macrs_cents(basis, rates)
+
+    total = section179 + bonus + schedule.sum()
+    return section179, bonus, basis, schedule, total
+
+
+if njit is not None:
+    _ads_cents = njit(cache=True)(_ads_cents)
+    _macrs_cents = njit(cache=True)(_macrs_cents)
+    _depreciate_asset_kernel = njit(cache=True)(_depreciate_asset_kernel)
+
+
 def depreciate_asset(
     asset: DepreciableAsset,
     bonus_rate: float,
     use_mid_quarter: bool = False
-) -> Dict:
+) -> DepreciationResult:
+
+    rates = _NO_RATES if asset.use_ads else _MACRS_RATES[asset.recovery_period]
+
+    _, bonus, basis, schedule, total = _depreciate_asset_kernel(
+        _to_cents(asset.cost),
+        _to_cents(asset.section179),
+        _to_rate_units(bonus_rate),
+        asset.recovery_period,
+        rates,
+        asset.use_ads,
+    )
+
+    return DepreciationResult(
+        cost=asset.cost,
+        section179=min(asset.cost, asset.section179),
+        bonus=bonus / 100,
+        remaining_basis=basis / 100,
+        schedule=(schedule / 100).tolist(),
+        total_depreciation=total / 100,
+    )
+
+
+def _depreciate_asset_fed_state(
+    asset: DepreciableAsset,
+    federal_bonus_rate: int,
+    state_bonus_rate: int
+) -> Tuple[DepreciationResult, DepreciationResult]:
+    """
+    depreciate_asset for the federal and state bonus rates (in rate units),
+    converting the asset and looking up its rates only once.
+    """
+    rates = _NO_RATES if asset.use_ads else _MACRS_RATES[asset.recovery_period]
+    cost = _to_cents(asset.cost)
+    elected = _to_cents(asset.section179)
+    section179 = min(asset.cost, asset.section179)
+
+    results = []
+    for bonus_rate in (federal_bonus_rate, state_bonus_rate):
+        _, bonus, basis, schedule, total = _depreciate_asset_kernel(
+            cost, elected, bonus_rate, asset.recovery_period, rates, asset.use_ads
+        )
+        results.append(DepreciationResult(
+            cost=asset.cost,
+            section179=section179,
+            bonus=bonus / 100,
+            remaining_basis=basis / 100,
+            schedule=(schedule / 100).tolist(),
+            total_depreciation=total / 100,
+        ))
 
-    # Section 179
-    basis = apply_section179(asset.cost, asset.section179)
-
-    # Bonus
-    bonus = bonus_depreciation(basis, bonus_rate)
-    basis -= bonus
-
-    # MACRS or ADS
-    if asset.use_ads:
-        schedule = ads_schedule(basis, asset.recovery_period)
-    else:
-        schedule = macrs_schedule(basis, asset.recovery_period)
-
-    return {
-        "cost": asset.cost,
-        "section179": min(asset.cost, asset.section179),
-        "bonus": bonus,
-        "remaining_basis": basis,
-        "schedule": schedule,
-        "total_depreciation": round(
-            min(asset.cost, asset.section179) + bonus + sum(schedule), 2
-        ),
-    }
+    return results[0], results[1]
 
 
 # =====================================================
 # POOL DEPRECIATION (FEDERAL / STATE)
 # =====================================================
 
+# Below this size thread start-up costs more than the serial loop
+PARALLEL_MIN_ASSETS = 32
+
+
+def _fill_row(
+    out: np.ndarray,
+    cost: int,
+    elected: int,
+    bonus_rate: int,
+    recovery_period: int,
+    rates: np.ndarray,
+    use_ads: bool
+) -> None:
+    _, bonus, basis, schedule, total = _depreciate_asset_kernel(
+        cost, elected, bonus_rate, recovery_period, rates, use_ads
+    )
+    out[0] = bonus
+    out[1] = basis
+    out[2] = total
+    out[3:3 + schedule.size] = schedule
+
+
+if njit is not None:
+    _fill_row = njit(cache=True, nogil=True)(_fill_row)
+
+
+def _depreciate_pool_kernel(
+    cost: np.ndarray,
+    elected: np.ndarray,
+    period: np.ndarray,
+    use_ads: np.ndarray,
+    rate_table: np.ndarray,
+    rate_lengths: np.ndarray,
+    federal_bonus_rate: int,
+    state_bonus_rate: int,
+    width: int
+):
+    """
+    Federal and state depreciation for every asset, one asset per thread.
+
+    Returns (federal, state), each an (n_assets, 3 + width) array of
+    bonus, remaining_basis, total, then the schedule padded with zeros,
+    all in cents.
+    """
+    n = cost.size
+    federal = np.zeros((n, 3 + width), dtype=np.int64)
+    state = np.zeros((n, 3 + width), dtype=np.int64)
+
+    for i in prange(n):
+        if use_ads[i]:
+            rates = rate_table[0, :0]
+        else:
+            rates = rate_table[period[i], :rate_lengths[period[i]]]
+
+        _fill_row(federal[i], cost[i], elected[i], federal_bonus_rate,
+                  period[i], rates, use_ads[i])
+        _fill_row(state[i], cost[i], elected[i], state_bonus_rate,
+                  period[i], rates, use_ads[i])
+
+    return federal, state
+
+
+if njit is not None:
+    _depreciate_pool_kernel = njit(
+        cache=True, nogil=True, parallel=True
+    )(_depreciate_pool_kernel)
+
+
+def _depreciate_pool_parallel(
+    assets: Sequence[DepreciableAsset],
+    bonus_rate: float,
+    state_bonus: float
+) -> Dict[str, List[DepreciationResult]]:
+    n = len(assets)
+    cost = np.empty(n, dtype=np.int64)
+    elected = np.empty(n, dtype=np.int64)
+    period = np.empty(n, dtype=np.int64)
+    use_ads = np.empty(n, dtype=np.bool_)
+    lengths = []
+
+    for i, asset in enumerate(assets):
+        # Reject bad periods here; the kernel doesn't bounds-check
+        if asset.use_ads:
+            if asset.recovery_period <= 0:
+                raise ZeroDivisionError("recovery period must be positive")
+        elif asset.recovery_period not in _MACRS_RATES:
+            raise KeyError(asset.recovery_period)
+
+        cost[i] = _to_cents(asset.cost)
+        elected[i] = _to_cents(asset.section179)
+        period[i] = asset.recovery_period
+        use_ads[i] = asset.use_ads
+        lengths.append(
+            asset.recovery_period if asset.use_ads
+            else len(MACRS_GDS_HALF_YEAR[asset.recovery_period])
+        )
+
+    federal_out, state_out = _depreciate_pool_kernel(
+        cost, elected, period, use_ads, _MACRS_RATE_TABLE, _MACRS_RATE_LENGTHS,
+        _to_rate_units(bonus_rate), _to_rate_units(state_bonus), max(lengths)
+    )
+
+    results = {"federal": [], "state": []}
+    for key, out in (("federal", federal_out), ("state", state_out)):
+        rows = results[key]
+        for asset, length, row in zip(assets, lengths, (out / 100).tolist()):
+            rows.append(DepreciationResult(
+                cost=asset.cost,
+                section179=min(asset.cost, asset.section179),
+                bonus=row[0],
+                remaining_basis=row[1],
+                schedule=row[3:3 + length],
+                total_depreciation=row[2],
+            ))
+
+    return results
+
+
 def depreciate_pool(
     pool: AssetPool,
     tax_config: Dict
-) -> Dict[str, List[Dict]]:
+) -> Dict[str, List[DepreciationResult]]:
 
     mid_q = requires_mid_quarter(pool.assets)
     bonus_rate = tax_config["bonus_rate"]
 
+    # State often disallows bonus/179
+    state_bonus = tax_config.get("state_bonus_rate", 0.0)
+
+    if njit is not None and len(pool.assets) >= PARALLEL_MIN_ASSETS:
+        return _depreciate_pool_parallel(pool.assets, bonus_rate, state_bonus)
+
+    federal_units = _to_rate_units(bonus_rate)
+    state_units = _to_rate_units(state_bonus)
+
     federal = []
     state = []
 
     for asset in pool.assets:
-        federal.append(
-            depreciate_asset(asset, bonus_rate, mid_q)
-        )
-
-        # State often disallows bonus/179
-        state_bonus = tax_config.get("state_bonus_rate", 0.0)
-        state.append(
-            depreciate_asset(
-                asset,
-                state_bonus,
-                mid_q
-            )
+        federal_result, state_result = _depreciate_asset_fed_state(
+            asset, federal_units, state_units
         )
+        federal.append(federal_result)
+        state.append(state_result)
 
     return {
         "federal": federal,
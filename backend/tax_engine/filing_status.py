@@ -0,0 +1,43 @@
+"""
+filing_status.py
+
+Filing status enum shared by the deduction, credit, and filing modules.
+
+Per-status tables are tuples indexed by FilingStatus, so a lookup is a
+single tuple subscript instead of lowercasing and hashing a string.
+"""
+
+from enum import IntEnum
+from typing import Union
+
+
+class FilingStatus(IntEnum):
+    SINGLE = 0
+    MARRIED_JOINT = 1
+    MARRIED_SEPARATE = 2
+    HEAD_OF_HOUSEHOLD = 3
+
+
+# Canonical lowercase names, indexed by FilingStatus
+FILING_STATUS_NAMES = tuple(status.name.lower() for status in FilingStatus)
+
+_parse_status = {
+    name: status for name, status in zip(FILING_STATUS_NAMES, FilingStatus)
+}.get
+
+
+def to_filing_status(status: Union[FilingStatus, str]) -> FilingStatus:
+    """
+    Normalize a FilingStatus or a case-insensitive status name.
+
+    :raises ValueError: If the name is not a known filing status
+    """
+    if type(status) is FilingStatus:
+        return status
+
+    parsed = _parse_status(status.lower())
+
+    if parsed is None:
+        raise ValueError(f"Invalid filing status: {status.lower()}")
+
+    return parsed
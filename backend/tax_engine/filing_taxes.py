@@ -9,34 +9,38 @@ Main tax filing logic that:
 - Applies credits
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Dict, Optional, Union
 
-from brackets import calculate_progressive_tax, DEFAULT_BRACKETS
+import numpy as np
+
+from brackets import (
+    calculate_progressive_tax,
+    brackets_to_arrays,
+    DEFAULT_BRACKETS,
+)
 from deductions import (
     get_standard_deduction,
     calculate_itemized_deductions,
     ItemizedDeductions,
 )
-from credits import calculate_total_credits
+from credits import calculate_total_credits, calculate_credits_batch
+from filing_status import FilingStatus, FILING_STATUS_NAMES, to_filing_status
 
 
 # -----------------------------
 # Filing Status Rules
 # -----------------------------
 
-VALID_FILING_STATUSES = {
-    "single",
-    "married_joint",
-    "married_separate",
-    "head_of_household",
-}
+VALID_FILING_STATUSES = set(FILING_STATUS_NAMES)
 
+DEDUCTION_STANDARD = "standard"
+DEDUCTION_ITEMIZED = "itemized"
 
-def validate_filing_status(status: str) -> str:
-    status = status.lower()
-    if status not in VALID_FILING_STATUSES:
-        raise ValueError(f"Invalid filing status: {status}")
-    return status
+
+@lru_cache(maxsize=256, typed=True)
+def validate_filing_status(status: Union[FilingStatus, str]) -> str:
+    return FILING_STATUS_NAMES[to_filing_status(status)]
 
 
 # -----------------------------
@@ -72,17 +76,16 @@ def file_taxes(
     # -----------------------------
     standard_deduction = get_standard_deduction(filing_status)
 
+    deduction_used = standard_deduction
+    deduction_type = DEDUCTION_STANDARD
+
     if itemized_deductions:
         itemized_total = calculate_itemized_deductions(
             itemized_deductions, agi
         )
-        deduction_used = max(standard_deduction, itemized_total)
-        deduction_type = (
-            "itemized" if itemized_total > standard_deduction else "standard"
-        )
-    else:
-        deduction_used = standard_deduction
-        deduction_type = "standard"
+        if itemized_total > standard_deduction:
+            deduction_used = itemized_total
+            deduction_type = DEDUCTION_ITEMIZED
 
     # -----------------------------
     # Taxable Income
@@ -101,4 +104,148 @@ def file_taxes(
     # -----------------------------
     credits = calculate_total_credits(
         filing_status=filing_status,
-        ag
+        agi=agi,
+        earned_income=earned_income,
+        qualifying_children=qualifying_children,
+    )
+
+    # -----------------------------
+    # Final Tax
+    # -----------------------------
+    # Nonrefundable CTC can only bring tax down to zero; the refundable
+    # CTC portion and the EITC can go past it into a refund.
+    ctc = credits["child_tax_credit"]
+    nonrefundable_applied = min(base_tax, ctc["nonrefundable"])
+    refundable_credits = ctc["refundable"] + credits["earned_income_tax_credit"]
+    net_tax = base_tax - nonrefundable_applied - refundable_credits
+
+    return {
+        "filing_status": filing_status,
+        "adjusted_gross_income": round(agi, 2),
+        "standard_deduction": standard_deduction,
+        "deduction_type": deduction_type,
+        "deduction_used": round(deduction_used, 2),
+        "taxable_income": round(taxable_income, 2),
+        "base_tax": base_tax,
+        "credits": credits,
+        "tax_due": round(max(0.0, net_tax), 2),
+        "refund": round(max(0.0, -net_tax), 2),
+    }
+
+
+# -----------------------------
+# Batch Tax Filing
+# -----------------------------
+
+# Standard deduction indexed by FilingStatus code, for the batch path
+_STANDARD_DEDUCTION_ARR = np.array(
+    [get_standard_deduction(status) for status in FilingStatus],
+    dtype=np.float64,
+)
+
+
+def file_taxes_batch(
+    *,
+    filing_statuses: np.ndarray,
+    gross_income: np.ndarray,
+    earned_income: np.ndarray,
+    qualifying_children: np.ndarray,
+    itemized_totals: Optional[np.ndarray] = None,
+    tax_brackets=DEFAULT_BRACKETS,
+) -> Dict[str, np.ndarray]:
+    """
+    Vectorized file_taxes over parallel arrays of returns.
+
+    :param filing_statuses: FilingStatus codes (integers)
+    :param itemized_totals: Optional itemized deduction totals, as from
+                            calculate_itemized_deductions; used where larger
+                            than the standard deduction
+    :return: Dict of per-return arrays. Amounts are rounded with np.round,
+             which can differ from round() by a cent on half-cent values.
+    """
+    statuses = np.asarray(filing_statuses, dtype=np.intp)
+    gross_income = np.asarray(gross_income, dtype=np.float64)
+    earned_income = np.asarray(earned_income, dtype=np.float64)
+
+    if statuses.size and (statuses.min() < 0 or statuses.max() >= len(FilingStatus)):
+        raise ValueError("Invalid filing status code")
+
+    if (gross_income < 0).any() or (earned_income < 0).any():
+        raise ValueError("Income values cannot be negative")
+
+    # -----------------------------
+    # Adjusted Gross Income (AGI)
+    # -----------------------------
+    agi = gross_income  # placeholder for future adjustments
+
+    # -----------------------------
+    # Deductions
+    # -----------------------------
+    standard_deduction = _STANDARD_DEDUCTION_ARR[statuses]
+
+    if itemized_totals is not None:
+        itemized_totals = np.asarray(itemized_totals, dtype=np.float64)
+        itemized = itemized_totals > standard_deduction
+        deduction_used = np.where(itemized, itemized_totals, standard_deduction)
+    else:
+        itemized = np.zeros(statuses.shape, dtype=np.bool_)
+        deduction_used = standard_deduction
+
+    # -----------------------------
+    # Taxable Income
+    # -----------------------------
+    taxable_income = np.maximum(0.0, agi - deduction_used)
+
+    # -----------------------------
+    # Base Tax
+    # -----------------------------
+    edges, rates, cum = brackets_to_arrays(tax_brackets)
+    bracket = np.maximum(np.searchsorted(edges, taxable_income, side="left") - 1, 0)
+    base_tax = np.where(
+        taxable_income > 0,
+        cum[bracket] + (taxable_income - edges[bracket]) * rates[bracket],
+        0.0,
+    )
+
+    # -----------------------------
+    # Credits
+    # -----------------------------
+    credits = calculate_credits_batch(
+        statuses, agi, earned_income, qualifying_children
+    )
+
+    # -----------------------------
+    # Final Tax
+    # -----------------------------
+    base_tax = np.round(base_tax, 2)
+    nonrefundable_applied = np.minimum(base_tax, credits["ctc_nonrefundable"])
+    refundable_credits = credits["ctc_refundable"] + credits["eitc"]
+    net_tax = base_tax - nonrefundable_applied - refundable_credits
+
+    return {
+        "adjusted_gross_income": agi,
+        "standard_deduction": standard_deduction,
+        "deduction_used": deduction_used,
+        "itemized": itemized,
+        "taxable_income": taxable_income,
+        "base_tax": base_tax,
+        "credits": credits,
+        "tax_due": np.round(np.maximum(0.0, net_tax), 2),
+        "refund": np.round(np.maximum(0.0, -net_tax), 2),
+    }
+
+
+# -----------------------------
+# Example Usage
+# -----------------------------
+
+if __name__ == "__main__":
+    summary = file_taxes(
+        filing_status="married_joint",
+        gross_income=95_000,
+        earned_income=95_000,
+        qualifying_children=2,
+    )
+
+    for key, value in summary.items():
+        print(key, value)
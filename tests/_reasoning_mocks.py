@@ -0,0 +1,54 @@
+"""
+Mock reasoning pipeline used by test_reasoning.py.
+
+In a real system, these would be imported from your modules.
+"""
+
+
+def nlp_parser(question: str) -> dict:
+    """
+    Extract intent and entities from natural language.
+    """
+    # Mock example
+    if "deduction" in question.lower():
+        return {"intent": "deduction_check", "entities": {}}
+    return {"intent": "general_inquiry", "entities": {}}
+
+def build_context(user_context: dict) -> dict:
+    """
+    Enrich or normalize user context.
+    """
+    ctx = user_context.copy()
+    ctx.setdefault("income", 0)
+    ctx.setdefault("filing_status", "single")
+    return ctx
+
+def route_rules(intent: str, context: dict) -> str:
+    """
+    Decide which rule engine / tax logic to run.
+    """
+    routing_table = {
+        "deduction_check": "deduction_rules",
+        "general_inquiry": "general_rules"
+    }
+    return routing_table.get(intent, "fallback_rules")
+
+def inference_engine(rule_path: str, context: dict) -> dict:
+    """
+    Mock deterministic + AI inference.
+    """
+    if rule_path == "deduction_rules":
+        answer = f"You may qualify for standard deduction of {context.get('income', 0) * 0.12:.2f}"
+    else:
+        answer = "General tax guidance."
+    reasoning_steps = (f"Applied {rule_path} based on context",)
+    return {"answer": answer, "reasoning_steps": reasoning_steps, "confidence": 0.85}
+
+def explain(inference_output: dict) -> str:
+    """
+    Build user-friendly explanation from reasoning.
+    """
+    # One join over the whole output; ("",) keeps the trailing newline
+    # after the header when there are no steps.
+    steps = inference_output.get("reasoning_steps") or ("",)
+    return "\n".join((inference_output["answer"], "Explanation Steps:", *steps))
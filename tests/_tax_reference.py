@@ -0,0 +1,45 @@
+"""
+Reference progressive-tax math used by test_tax_engine.py.
+
+_expected_tax is njit-compiled when numba is installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the reference tax loop then runs interpreted
+    njit = None
+
+
+def _expected_tax(taxable_income, starts, rates):
+    remaining_income = taxable_income
+    tax = 0.0
+    n = starts.shape[0]
+    for i in range(n):
+        taxable_at_rate = remaining_income
+        if i + 1 < n:
+            taxable_at_rate = min(remaining_income, starts[i + 1] - starts[i])
+        tax += taxable_at_rate * rates[i]
+        remaining_income -= taxable_at_rate
+        if remaining_income <= 0:
+            break
+    return tax
+
+if njit is not None:
+    _expected_tax = njit(cache=True, boundscheck=False)(_expected_tax)
+
+def calculate_expected_tax(taxable_income, brackets):
+    """
+    Deterministic progressive tax calculation for testing
+    """
+    starts = np.array([start for start, _ in brackets], dtype=np.float64)
+    rates = np.array([rate for _, rate in brackets], dtype=np.float64)
+    return round(_expected_tax(float(taxable_income), starts, rates), 2)
+
+def calc_tax(incomes, starts, rates):
+    """
+    Vectorized calculate_expected_tax over an array of taxable incomes.
+    """
+    widths = np.diff(np.append(starts, np.inf))
+    return np.clip(incomes[:, None] - starts, 0, widths) @ rates
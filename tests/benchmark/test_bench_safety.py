@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from safety_checks import REQUIRED_DISCLAIMER, safety_gate, sanitize_response
+
+# A long, safe answer that still exercises every phrase scan
+SAFE_RESPONSE = (
+    "The IRS generally allows a standard deduction for most filers. "
+    "This is general information for educational purposes. "
+) * 20 + REQUIRED_DISCLAIMER
+
+UNSAFE_RESPONSE = (
+    "You should move your income offshore and avoid paying tax. "
+) * 20
+
+# The list value makes the context unhashable, so safety_gate skips its
+# result cache and every round measures the full scan.
+UNCACHED_CONTEXT = {"jurisdiction": "US", "notes": []}
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+
+def test_bench_safety_gate(benchmark):
+    result = benchmark.pedantic(
+        safety_gate, args=(SAFE_RESPONSE, UNCACHED_CONTEXT), rounds=200, iterations=10
+    )
+    assert result.allowed
+
+def test_bench_sanitize_response(benchmark):
+    sanitized = benchmark.pedantic(
+        sanitize_response, args=(UNSAFE_RESPONSE,), rounds=200, iterations=10
+    )
+    assert "you should" not in sanitized.lower()
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from brackets import DEFAULT_BRACKETS, calculate_progressive_tax_array, tax_default
+from tax_api import FEDERAL_TAX_BRACKETS_2024, calculate_progressive_tax
+
+# Taxable income for the $85,000 single filer used across test_tax_engine.py
+TAXABLE_INCOME = 70400
+
+INCOMES = np.linspace(0, 1_000_000, 10_000)
+
+# One unmeasured round first, so a cold numba cache (JIT compile on first
+# call) never lands in the timings.
+WARMUP_ROUNDS = 1
+
+# -----------------------------
+# Benchmarks
+# -----------------------------
+
+def test_bench_api_progressive_tax(benchmark):
+    brackets = FEDERAL_TAX_BRACKETS_2024["single"]
+    details = benchmark.pedantic(
+        calculate_progressive_tax,
+        args=(TAXABLE_INCOME, brackets),
+        rounds=200,
+        iterations=50,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
+    assert len(details) == 3
+
+def test_bench_engine_default_brackets(benchmark):
+    tax = benchmark.pedantic(
+        tax_default,
+        args=(TAXABLE_INCOME,),
+        rounds=200,
+        iterations=500,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
+    assert tax > 0
+
+def test_bench_engine_tax_array(benchmark):
+    taxes = benchmark.pedantic(
+        calculate_progressive_tax_array,
+        args=(INCOMES, DEFAULT_BRACKETS),
+        rounds=50,
+        iterations=5,
+        warmup_rounds=WARMUP_ROUNDS,
+    )
+    assert taxes.shape == INCOMES.shape
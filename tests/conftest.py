@@ -0,0 +1,123 @@
+"""
+Shared fixtures for the API tests.
+
+Each app's client is entered once per session, so FastAPI startup and
+shutdown and the client's event loop are reused by every test. Apps are
+imported inside the fixtures so suites that don't use them never import
+them.
+
+The async_* clients call the app in-process through httpx's
+ASGITransport; tests using them run on the session event loop
+(pytest.mark.asyncio(loop_scope="session")). Each app runs as its own
+server, so live mode is configured per app: set API_TEST_AI_BASE_URL,
+API_TEST_TAX_BASE_URL, API_TEST_USER_BASE_URL or API_TEST_AUTH_BASE_URL
+to run that app's async client against a running server instead; its
+requests then reuse pooled keep-alive connections.
+"""
+
+import os
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi.testclient import TestClient
+
+# Benchmarks only run when asked for:
+#   pytest tests/benchmark --benchmark-only --benchmark-save=baseline
+collect_ignore = ["benchmark"]
+
+# Integration mode: point an app's async client at its running server
+LIVE_BASE_URLS = {
+    name: os.environ.get(f"API_TEST_{name.upper()}_BASE_URL")
+    for name in ("ai", "tax", "user", "auth")
+}
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+try:
+    import h2  # noqa: F401
+except ImportError:  # h2 is optional; live clients then speak HTTP/1.1
+    h2 = None
+
+
+def pytest_configure(config):
+    # Always list the slowest tests; an explicit --durations still wins.
+    if config.option.durations is None:
+        config.option.durations = 20
+
+
+@pytest.fixture(scope="session")
+def ai_client():
+    from ai_api import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def tax_client():
+    from tax_api import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def user_client():
+    from user_api import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def auth_client():
+    from auth import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+def _transport(app, live_base_url):
+    if live_base_url:
+        return httpx.AsyncHTTPTransport(limits=POOL_LIMITS, http2=h2 is not None)
+    return httpx.ASGITransport(app=app)
+
+
+async def _async_client(app, name):
+    live_base_url = LIVE_BASE_URLS[name]
+    transport = _transport(app, live_base_url)
+    base_url = live_base_url or "http://test"
+    async with httpx.AsyncClient(transport=transport, base_url=base_url) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_ai_client():
+    from ai_api import app
+
+    async for client in _async_client(app, "ai"):
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_tax_client():
+    from tax_api import app
+
+    async for client in _async_client(app, "tax"):
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_user_client():
+    from user_api import app
+
+    async for client in _async_client(app, "user"):
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_auth_client():
+    from auth import app
+
+    async for client in _async_client(app, "auth"):
+        yield client
@@ -1,19 +1,15 @@
+import json
+
 import pytest
-from fastapi.testclient import TestClient
-from ai_api import app as ai_app
-from tax_api import app as tax_app
-from user_api import app as user_app
-from auth import app as auth_app
 from settings import CONFIG
 
-# -----------------------------
-# Setup Test Clients
-# -----------------------------
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
 
-ai_client = TestClient(ai_app)
-tax_client = TestClient(tax_app)
-user_client = TestClient(user_app)
-auth_client = TestClient(auth_app)
+# Test clients (async_ai_client, async_tax_client, ...) are session-scoped
+# fixtures in conftest.py; async tests run on the session event loop.
 
 # -----------------------------
 # Test Data
@@ -41,34 +37,64 @@ AUTH_PAYLOAD = {
     "password": "password123"
 }
 
+JSON_HEADERS = {"content-type": "application/json"}
+
+def dumps(payload) -> bytes:
+    """
+    Encode a request body once so unchanged payloads aren't re-serialized per call.
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+USER_PROFILE_BYTES = dumps(USER_PROFILE_PAYLOAD)
+REASONING_BYTES = dumps({"question": REASONING_QUESTION, "user_context": USER_PROFILE_PAYLOAD})
+TAX_CALC_BYTES = dumps(TAX_CALC_PAYLOAD)
+ZERO_INCOME_TAX_CALC_BYTES = dumps({**TAX_CALC_PAYLOAD, "incomes": [{"source": "salary", "amount": 0}]})
+AUTH_BYTES = dumps(AUTH_PAYLOAD)
+WRONG_PASSWORD_AUTH_BYTES = dumps({"username": AUTH_PAYLOAD["username"], "password": "wrongpassword"})
+
 # -----------------------------
 # Reasoning API Tests
 # -----------------------------
 
-def test_reasoning_endpoint_returns_answer():
-    response = ai_client.post("/reason", json={"question": REASONING_QUESTION, "user_context": USER_PROFILE_PAYLOAD})
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reasoning_endpoint_returns_answer(async_ai_client):
+    response = await async_ai_client.post("/reason", content=REASONING_BYTES, headers=JSON_HEADERS)
     assert response.status_code == 200
     data = response.json()
     assert "answer" in data
     assert "reasoning_steps" in data
     assert isinstance(data["reasoning_steps"], list)
 
+@pytest.mark.asyncio(loop_scope="session")
+async def test_reasoning_cache_keeps_value_types_apart(async_ai_client):
+    # 85000 and 85000.0 compare equal but must not share a cached answer
+    steps = []
+    for income in (85000, 85000.0):
+        body = dumps({"question": REASONING_QUESTION, "context": {"income": income}})
+        response = await async_ai_client.post("/reasoning", content=body, headers=JSON_HEADERS)
+        assert response.status_code == 200
+        steps.append(response.json()["reasoning_steps"])
+    assert "Reviewed reported income of 85000" in steps[0]
+    assert "Reviewed reported income of 85000.0" in steps[1]
+
 # -----------------------------
 # Tax Calculation API Tests
 # -----------------------------
 
-def test_tax_calculation_endpoint_returns_expected_keys():
-    response = tax_client.post("/tax/calculate", json=TAX_CALC_PAYLOAD)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tax_calculation_endpoint_returns_expected_keys(async_tax_client):
+    response = await async_tax_client.post("/tax/calculate", content=TAX_CALC_BYTES, headers=JSON_HEADERS)
     assert response.status_code == 200
     data = response.json()
     expected_keys = ["gross_income", "deduction_used", "taxable_income", "total_tax_before_credits", "credits_applied", "total_tax_liability", "bracket_breakdown"]
     for key in expected_keys:
         assert key in data
 
-def test_tax_calculation_handles_zero_income():
-    payload = TAX_CALC_PAYLOAD.copy()
-    payload["incomes"] = [{"source": "salary", "amount": 0}]
-    response = tax_client.post("/tax/calculate", json=payload)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_tax_calculation_handles_zero_income(async_tax_client):
+    response = await async_tax_client.post("/tax/calculate", content=ZERO_INCOME_TAX_CALC_BYTES, headers=JSON_HEADERS)
     data = response.json()
     assert data["total_tax_liability"] == 0
 
@@ -76,17 +102,19 @@ def test_tax_calculation_handles_zero_income():
 # User Profile API Tests
 # -----------------------------
 
-def test_create_user_profile():
-    response = user_client.post("/user/create", json=USER_PROFILE_PAYLOAD)
+@pytest.mark.asyncio(loop_scope="session")
+async def test_create_user_profile(async_user_client):
+    response = await async_user_client.post("/user/create", content=USER_PROFILE_BYTES, headers=JSON_HEADERS)
     assert response.status_code == 200
     data = response.json()
     assert data["user_id"] == USER_PROFILE_PAYLOAD["user_id"]
     assert "name" in data
     assert "filing_status" in data
 
-def test_get_user_profile():
-    user_client.post("/user/create", json=USER_PROFILE_PAYLOAD)
-    response = user_client.get(f"/user/{USER_PROFILE_PAYLOAD['user_id']}")
+@pytest.mark.asyncio(loop_scope="session")
+async def test_get_user_profile(async_user_client):
+    await async_user_client.post("/user/create", content=USER_PROFILE_BYTES, headers=JSON_HEADERS)
+    response = await async_user_client.get(f"/user/{USER_PROFILE_PAYLOAD['user_id']}")
     assert response.status_code == 200
     data = response.json()
     assert data["user_id"] == USER_PROFILE_PAYLOAD["user_id"]
@@ -95,22 +123,24 @@ def test_get_user_profile():
 # Authentication API Tests
 # -----------------------------
 
-def test_register_and_login_user():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_register_and_login_user(async_auth_client):
     # Register
-    response = auth_client.post("/auth/register", json=AUTH_PAYLOAD)
+    response = await async_auth_client.post("/auth/register", content=AUTH_BYTES, headers=JSON_HEADERS)
     assert response.status_code == 200
     data = response.json()
     assert "username" in data
 
     # Login
-    response = auth_client.post("/auth/login", json=AUTH_PAYLOAD)
+    response = await async_auth_client.post("/auth/login", content=AUTH_BYTES, headers=JSON_HEADERS)
     assert response.status_code == 200
     login_data = response.json()
     assert "access_token" in login_data
     assert "token_type" in login_data
 
-def test_authentication_fails_invalid_password():
-    response = auth_client.post("/auth/login", json={"username": AUTH_PAYLOAD["username"], "password": "wrongpassword"})
+@pytest.mark.asyncio(loop_scope="session")
+async def test_authentication_fails_invalid_password(async_auth_client):
+    response = await async_auth_client.post("/auth/login", content=WRONG_PASSWORD_AUTH_BYTES, headers=JSON_HEADERS)
     assert response.status_code == 401
     data = response.json()
     assert data["detail"] == "Invalid credentials"
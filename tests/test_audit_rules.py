@@ -0,0 +1,148 @@
+import random
+from dataclasses import asdict
+
+import pytest
+
+from audit_rules import Assets, run_audit
+from depreciation import DepreciableAsset, depreciate_asset
+
+# -----------------------------------
+# Reference (per-asset dict) behaviour
+# -----------------------------------
+
+def reference_total(assets):
+    return sum(
+        sum(a.get("schedule", [])) + a.get("section179", 0) + a.get("bonus", 0)
+        for a in assets
+    )
+
+def reference_flags(federal_assets, state_assets, config, prior_year_depreciation=None):
+    """
+    Flag codes the rules raised when they summed over the asset dicts.
+    """
+    codes = []
+
+    if sum(a.get("section179", 0) for a in federal_assets) > config.get(
+        "section179_soft_limit", 1_000_000
+    ):
+        codes.append("DEP179_HIGH")
+
+    bonus_total = sum(a.get("bonus", 0) for a in federal_assets)
+    cost_total = sum(a.get("cost", 0) for a in federal_assets)
+    if cost_total > 0 and bonus_total / cost_total > 0.8:
+        codes.append("BONUS_HEAVY")
+
+    if any(len(a.get("schedule", [])) <= 3 for a in federal_assets):
+        codes.append("SHORT_RECOVERY")
+
+    federal_total = reference_total(federal_assets)
+    state_total = reference_total(state_assets)
+
+    if prior_year_depreciation and federal_total / prior_year_depreciation > 2.5:
+        codes.append("YOY_SPIKE")
+
+    if federal_total != 0 and abs(federal_total - state_total) / federal_total > 0.5:
+        codes.append("STATE_MISMATCH")
+
+    return codes
+
+# -----------------------------------
+# Test Data
+# -----------------------------------
+
+def _depreciated(bonus_rate):
+    """
+    Result dicts for MACRS and ADS assets of every kind of recovery period.
+    """
+    assets = [
+        DepreciableAsset(cost=50_000, recovery_period=3, placed_in_service_qtr=1),
+        DepreciableAsset(cost=12_345.67, recovery_period=5, placed_in_service_qtr=2, section179=5_000),
+        DepreciableAsset(cost=80_000, recovery_period=7, placed_in_service_qtr=4),
+        DepreciableAsset(cost=1_000_000, recovery_period=39, placed_in_service_qtr=3, use_ads=True),
+        DepreciableAsset(cost=250_000, recovery_period=15, placed_in_service_qtr=1, section179=300_000),
+    ]
+    return [asdict(depreciate_asset(asset, bonus_rate)) for asset in assets]
+
+MIXED_ASSETS = [
+    {},
+    {"cost": 10_000},
+    {"cost": 5_000, "bonus": 4_000, "schedule": [100, 200]},
+    {"cost": 7_500.25, "section179": 1_000.5, "schedule": [0.1] * 12},
+    {"cost": 20_000, "bonus": 0, "section179": 0, "schedule": []},
+]
+
+def _random_assets(rng, count):
+    assets = []
+    for _ in range(count):
+        cost = rng.uniform(0, 500_000)
+        asset = {"cost": cost, "schedule": [rng.uniform(0, cost / 5) for _ in range(rng.randint(0, 12))]}
+        if rng.random() < 0.5:
+            asset["section179"] = rng.uniform(0, cost)
+        if rng.random() < 0.5:
+            asset["bonus"] = rng.uniform(0, cost)
+        assets.append(asset)
+    return assets
+
+def _random_audits(count=300):
+    rng = random.Random(0)
+    audits = []
+    for _ in range(count):
+        federal = _random_assets(rng, rng.randint(0, 200))
+        state = _random_assets(rng, rng.randint(0, 200))
+        prior = rng.choice([None, 0, rng.uniform(1, 5_000_000)])
+        limit = rng.uniform(0, 5_000_000)
+        audits.append((federal, state, {"section179_soft_limit": limit}, prior))
+    return audits
+
+AUDITS = {
+    "empty": ([], [], {}, None),
+    "empty_state": (MIXED_ASSETS, [], {}, 1_000),
+    "empty_federal": ([], MIXED_ASSETS, {}, 1_000),
+    "mixed_dicts": (MIXED_ASSETS, MIXED_ASSETS[:3], {"section179_soft_limit": 1_000}, 10_000),
+    "depreciated": (_depreciated(0.6), _depreciated(0.0), {}, 100_000),
+    # Ten 0.1s total 0.9999999999999999 left to right but 1.0 pairwise,
+    # which would cross this limit
+    "section179_at_limit": (
+        [{"section179": 0.1, "schedule": [1] * 5}] * 10,
+        [],
+        {"section179_soft_limit": 0.9999999999999999},
+        None,
+    ),
+}
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+def _codes(result):
+    return [flag.code for flag in result.flags]
+
+@pytest.mark.parametrize("name", list(AUDITS))
+def test_run_audit_matches_per_asset_rules(name):
+    federal, state, config, prior = AUDITS[name]
+    result = run_audit(federal, state, config, prior)
+    assert _codes(result) == reference_flags(federal, state, config, prior)
+
+def test_run_audit_matches_on_random_asset_lists():
+    for federal, state, config, prior in _random_audits():
+        assert _codes(run_audit(federal, state, config, prior)) == reference_flags(
+            federal, state, config, prior
+        )
+
+def test_depreciation_total_sums_asset_by_asset():
+    rng = random.Random(1)
+    for assets in [[], MIXED_ASSETS, _depreciated(1.0)] + [_random_assets(rng, 300) for _ in range(20)]:
+        assert Assets.from_dicts(assets).depreciation_total() == reference_total(assets)
+
+def test_empty_audit_is_low_risk():
+    result = run_audit([], [], {})
+    assert (result.total_score, result.flags, result.risk_level) == (0, [], "LOW")
+
+def test_score_is_capped_and_bucketed():
+    federal = [{"cost": 100, "bonus": 90, "section179": 2_000_000, "schedule": [1]}]
+    result = run_audit(federal, [], {}, prior_year_depreciation=1)
+    assert _codes(result) == [
+        "DEP179_HIGH", "BONUS_HEAVY", "SHORT_RECOVERY", "YOY_SPIKE", "STATE_MISMATCH"
+    ]
+    assert result.total_score == 20 + 15 + 10 + 18 + 12
+    assert result.risk_level == "SEVERE"
@@ -0,0 +1,101 @@
+import importlib
+import os
+
+import pytest
+
+# -----------------------------------
+# Fixtures
+# -----------------------------------
+
+@pytest.fixture(scope="module")
+def audit_trail(tmp_path_factory):
+    """
+    Import audit_trail from a scratch directory, since it opens audit.log
+    in the working directory at import time.
+    """
+    cwd = os.getcwd()
+    os.chdir(tmp_path_factory.mktemp("audit"))
+    try:
+        module = importlib.import_module("audit_trail")
+    finally:
+        os.chdir(cwd)
+    return module
+
+@pytest.fixture
+def read_log(audit_trail, tmp_path, monkeypatch):
+    """
+    Point the trail at a fresh file; the returned callable flushes and reads it.
+    """
+    log_file = open(tmp_path / "audit.log", "ab")
+    monkeypatch.setattr(audit_trail, "_AUDIT_FILE", log_file)
+
+    def read():
+        audit_trail.flush_now()
+        return (tmp_path / "audit.log").read_text().splitlines()
+
+    yield read
+    audit_trail.flush_now()
+    log_file.close()
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+def test_details_are_recorded_as_of_the_call(audit_trail, read_log):
+    details = {"amount": 1}
+    audit_trail.AuditTrail.log_event("u1", "approve", details)
+    details["amount"] = 999999
+    lines = read_log()
+    assert lines[-1].endswith("User: u1 | Action: approve | Details: {'amount': 1}")
+
+def test_large_bursts_are_not_dropped(audit_trail, read_log):
+    events = [("u2", f"action-{i}", None) for i in range(100_000)]
+    audit_trail.AuditTrail.log_event_batch(events)
+    lines = read_log()
+    assert len(lines) == len(events)
+    assert lines[0].endswith("Action: action-0 | Details: {}")
+    assert lines[-1].endswith("Action: action-99999 | Details: {}")
+
+def test_failed_write_is_retried(audit_trail, read_log, monkeypatch):
+    class FullDisk:
+        def write(self, data):
+            raise OSError("disk full")
+
+    good_file = audit_trail._AUDIT_FILE
+    monkeypatch.setattr(audit_trail, "_AUDIT_FILE", FullDisk())
+    audit_trail.AuditTrail.log_warning("u3", "retry me")
+    with pytest.raises(OSError):
+        audit_trail.flush_now()
+
+    monkeypatch.setattr(audit_trail, "_AUDIT_FILE", good_file)
+    lines = read_log()
+    assert lines[-1].endswith("[WARNING] User: u3 | Warning: retry me")
+
+def test_batch_shares_one_timestamp_in_order(audit_trail, read_log):
+    audit_trail.AuditTrail.log_event_batch(
+        (f"u{i}", "file", {"return": i}) for i in range(5)
+    )
+    lines = read_log()
+    assert len(lines) == 5
+    assert len({line.split(" [INFO] ")[0] for line in lines}) == 1
+    assert [line.split(" [INFO] ")[1] for line in lines] == [
+        f"User: u{i} | Action: file | Details: {{'return': {i}}}" for i in range(5)
+    ]
+
+def test_batch_snapshots_details(audit_trail, read_log):
+    details = {"status": "pending"}
+    audit_trail.AuditTrail.log_event_batch([("u4", "submit", details)])
+    details["status"] = "changed"
+    assert read_log()[-1].endswith("Details: {'status': 'pending'}")
+
+def test_batch_interleaves_with_single_events(audit_trail, read_log):
+    audit_trail.AuditTrail.log_event("u5", "first")
+    audit_trail.AuditTrail.log_event_batch([("u5", "second", None), ("u5", "third", None)])
+    audit_trail.AuditTrail.log_event_batch([])
+    audit_trail.AuditTrail.log_event("u5", "fourth")
+    assert [line.split("Action: ")[1] for line in read_log()] == [
+        "first | Details: {}",
+        "second | Details: {}",
+        "third | Details: {}",
+        "fourth | Details: {}",
+    ]
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+
+from brackets import (
+    DEFAULT_BRACKETS,
+    DEFAULT_BRACKETS_KEY,
+    CompiledBrackets,
+    calculate_progressive_tax,
+    calculate_progressive_tax_array,
+    calculate_progressive_tax_cached,
+    register_brackets,
+)
+
+# -----------------------------------
+# Test Data
+# -----------------------------------
+
+CUSTOM_BRACKETS = [
+    (11_000, 0.10),
+    (44_725, 0.12),
+    (95_375, 0.22),
+    (None, 0.24),
+]
+
+# No open-ended top bracket: income above the last limit is untaxed
+CAPPED_BRACKETS = [
+    (5_000, 0.05),
+    (20_000, 0.15),
+]
+
+def _incomes(brackets):
+    """
+    Zero, negatives, each bracket limit and its neighbours, plus random draws.
+    """
+    incomes = [-1_000.0, -0.01, 0.0, 0.01]
+    for limit, _ in brackets:
+        if limit is not None:
+            incomes += [limit - 0.01, float(limit), limit + 0.01]
+    rng = np.random.default_rng(0)
+    incomes += list(np.round(rng.uniform(0, 250_000, 2_000), 2))
+    return np.array(incomes, dtype=np.float64)
+
+# np.round rounds half to even, so allow a cent on half-cent values
+CENT = 0.011
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+@pytest.mark.parametrize("brackets", [DEFAULT_BRACKETS, CUSTOM_BRACKETS, CAPPED_BRACKETS])
+def test_array_matches_scalar(brackets):
+    incomes = _incomes(brackets)
+    expected = [calculate_progressive_tax(income, brackets) for income in incomes]
+    np.testing.assert_allclose(
+        calculate_progressive_tax_array(incomes, brackets), expected, rtol=0, atol=CENT
+    )
+
+def test_array_defaults_to_default_brackets():
+    incomes = _incomes(DEFAULT_BRACKETS)
+    np.testing.assert_array_equal(
+        calculate_progressive_tax_array(incomes),
+        calculate_progressive_tax_array(incomes, DEFAULT_BRACKETS),
+    )
+
+def test_array_accepts_lists_and_empty_input():
+    assert calculate_progressive_tax_array([75_000]).tolist() == [
+        calculate_progressive_tax(75_000, DEFAULT_BRACKETS)
+    ]
+    assert calculate_progressive_tax_array(np.empty(0)).shape == (0,)
+
+@pytest.mark.parametrize("brackets", [DEFAULT_BRACKETS, CUSTOM_BRACKETS, CAPPED_BRACKETS])
+def test_compiled_brackets_match_scalar(brackets):
+    compiled = CompiledBrackets(brackets)
+    incomes = _incomes(brackets)
+    expected = [calculate_progressive_tax(income, brackets) for income in incomes]
+
+    assert [compiled.tax(income) for income in incomes] == expected
+    np.testing.assert_allclose(compiled.tax_array(incomes), expected, rtol=0, atol=CENT)
+
+def test_compiled_brackets_cumulative_tax_at_limits():
+    compiled = CompiledBrackets(DEFAULT_BRACKETS)
+    assert compiled.starts.tolist() == [0.0, 10_000, 40_000, 80_000]
+    assert compiled.cum.tolist() == [0.0, 1_000, 7_000, 19_000]
+    assert compiled.rates.tolist() == [0.10, 0.20, 0.30, 0.40]
+
+def test_compiled_brackets_without_top_bracket_stop_taxing():
+    compiled = CompiledBrackets(CAPPED_BRACKETS)
+    assert compiled.tax(1_000_000) == compiled.tax(20_000) == 2_500.0
+    assert compiled.tax_array([20_000, 1_000_000]).tolist() == [2_500.0, 2_500.0]
+
+def test_cached_matches_scalar_for_registered_brackets():
+    key = register_brackets(CUSTOM_BRACKETS)
+    assert register_brackets(CUSTOM_BRACKETS) == key
+
+    for income in _incomes(CUSTOM_BRACKETS)[:50]:
+        assert calculate_progressive_tax_cached(float(income), key) == (
+            calculate_progressive_tax(income, CUSTOM_BRACKETS)
+        )
+    assert calculate_progressive_tax_cached(75_000.0, DEFAULT_BRACKETS_KEY) == (
+        calculate_progressive_tax(75_000.0, DEFAULT_BRACKETS)
+    )
+
+def test_cached_repeats_are_hits():
+    calculate_progressive_tax_cached.cache_clear()
+    calculate_progressive_tax_cached(52_000.0, DEFAULT_BRACKETS_KEY)
+    calculate_progressive_tax_cached(52_000.0, DEFAULT_BRACKETS_KEY)
+
+    info = calculate_progressive_tax_cached.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+def test_cached_unregistered_key_raises():
+    unregistered = [(None, 0.5)]
+    with pytest.raises(ValueError, match="Unregistered brackets key"):
+        calculate_progressive_tax_cached(1_000.0, id(unregistered))
+
+def test_default_brackets_are_immutable():
+    with pytest.raises(TypeError):
+        DEFAULT_BRACKETS[0] = (20_000, 0.10)
+
+def test_default_shortcut_matches_generic_path():
+    incomes = _incomes(DEFAULT_BRACKETS)
+    as_list = list(DEFAULT_BRACKETS)
+    assert [calculate_progressive_tax(income, DEFAULT_BRACKETS) for income in incomes] == [
+        calculate_progressive_tax(income, as_list) for income in incomes
+    ]
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from credits import (
+    CTC_PHASEOUT_THRESHOLDS,
+    EITC_RULES,
+    calculate_credits_batch,
+    calculate_total_credits,
+)
+from filing_status import FilingStatus
+
+# -----------------------------------
+# Test Data
+# -----------------------------------
+
+def _eitc_edges(children):
+    """
+    Incomes around the EITC plateau start, phase-out start and zero point.
+    """
+    rule = EITC_RULES[min(children, 3)]
+    plateau = rule.max_credit / rule.phase_in_rate
+    zero = rule.phase_out_start + rule.max_credit / rule.phase_out_rate
+    edges = []
+    for point in (0.0, plateau, rule.phase_out_start, zero):
+        edges += [max(0.0, point - 0.01), point, point + 0.01]
+    return edges
+
+def _taxpayers():
+    """
+    (status, agi, earned_income, children) rows: EITC edges for 0-5
+    children, CTC phase-out edges for every status, and random draws.
+    """
+    rows = []
+    for status in FilingStatus:
+        for children in range(6):
+            for income in _eitc_edges(children):
+                rows.append((status, income, income, children))
+            threshold = CTC_PHASEOUT_THRESHOLDS[status.name.lower()]
+            for agi in (threshold, threshold + 999.99, threshold + 1_000, threshold + 250_000):
+                rows.append((status, agi, agi, children))
+
+    rng = np.random.default_rng(0)
+    for _ in range(2_000):
+        agi = round(float(rng.uniform(0, 500_000)), 2)
+        rows.append((
+            FilingStatus(int(rng.integers(len(FilingStatus)))),
+            agi,
+            round(agi * float(rng.uniform(0, 1)), 2),
+            int(rng.integers(0, 6)),
+        ))
+    return rows
+
+TAXPAYERS = _taxpayers()
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+def test_batch_matches_scalar_row_by_row():
+    statuses, agi, earned, children = (list(column) for column in zip(*TAXPAYERS))
+    batch = calculate_credits_batch(statuses, agi, earned, children)
+
+    assert batch.shape == (len(TAXPAYERS),)
+    for row, (status, row_agi, row_earned, row_children) in zip(batch, TAXPAYERS):
+        scalar = calculate_total_credits(status, row_agi, row_earned, row_children)
+        ctc = scalar["child_tax_credit"]
+        expected = (
+            ctc["total"],
+            ctc["refundable"],
+            ctc["nonrefundable"],
+            scalar["earned_income_tax_credit"],
+            scalar["total_credits"],
+        )
+        # np.round rounds half to even, so allow a cent on half-cent values
+        np.testing.assert_allclose(
+            row.tolist(), expected, rtol=0, atol=0.011,
+            err_msg=f"{status.name} agi={row_agi} earned={row_earned} children={row_children}",
+        )
+
+def test_no_children_gets_no_ctc():
+    batch = calculate_credits_batch([FilingStatus.SINGLE], [12_000], [12_000], [0])
+    assert batch["ctc_total"][0] == 0.0
+    assert batch["eitc"][0] == calculate_total_credits("single", 12_000, 12_000, 0)["earned_income_tax_credit"]
+
+@pytest.mark.parametrize("code", [-1, len(FilingStatus)])
+def test_unknown_status_code_raises(code):
+    with pytest.raises(ValueError, match="Invalid filing status code"):
+        calculate_credits_batch([code], [50_000], [50_000], [1])
+
+def test_negative_children_raises():
+    with pytest.raises(ValueError, match="cannot be negative"):
+        calculate_credits_batch([FilingStatus.SINGLE], [50_000], [50_000], [-1])
@@ -114,13 +114,11 @@ def test_invalid_form_data_raises_errors():
     """
     Ensure invalid form fields raise validation errors
     """
-    invalid_w2 = MOCK_W2.copy()
-    invalid_w2["wages"] = -50000
+    invalid_w2 = {**MOCK_W2, "wages": -50000}
     with pytest.raises(ValueError):
         parse_w2_form(invalid_w2)
 
-    invalid_1099 = MOCK_1099.copy()
-    invalid_1099["nonemployee_comp"] = "twelve thousand"
+    invalid_1099 = {**MOCK_1099, "nonemployee_comp": "twelve thousand"}
     with pytest.raises(ValueError):
         parse_1099_form(invalid_1099)
 
@@ -0,0 +1,53 @@
+import pytest
+
+from deductions import (
+    STANDARD_DEDUCTIONS,
+    ItemizedDeductions,
+    calculate_best_deduction,
+    get_standard_deduction,
+)
+from filing_status import FilingStatus
+
+# -----------------------------------
+# Standard Deduction
+# -----------------------------------
+
+@pytest.mark.parametrize("name,expected", list(STANDARD_DEDUCTIONS.items()))
+def test_standard_deduction_by_name_and_member(name, expected):
+    assert get_standard_deduction(name) == expected
+    assert get_standard_deduction(name.upper()) == expected
+    assert get_standard_deduction(FilingStatus[name.upper()]) == expected
+
+def test_standard_deduction_is_cached():
+    get_standard_deduction.cache_clear()
+    get_standard_deduction("single")
+    get_standard_deduction("single")
+    info = get_standard_deduction.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+def test_cache_keys_members_and_names_separately():
+    # typed=True: a FilingStatus member and an int/str never share an entry
+    get_standard_deduction.cache_clear()
+    assert get_standard_deduction(FilingStatus.MARRIED_JOINT) == STANDARD_DEDUCTIONS["married_joint"]
+    assert get_standard_deduction("married_joint") == STANDARD_DEDUCTIONS["married_joint"]
+    assert get_standard_deduction.cache_info().misses == 2
+
+def test_invalid_status_raises_every_time():
+    # Exceptions are not cached, so repeated bad input keeps raising
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid filing status: widowed"):
+            get_standard_deduction("Widowed")
+
+# -----------------------------------
+# Best Deduction
+# -----------------------------------
+
+def test_best_deduction_defaults_to_standard():
+    result = calculate_best_deduction("single", 60_000)
+    assert result == {"deduction_type": "standard", "deduction_amount": STANDARD_DEDUCTIONS["single"]}
+
+def test_best_deduction_picks_larger_itemized():
+    itemized = ItemizedDeductions(state_local_taxes=12_000, mortgage_interest=8_000)
+    result = calculate_best_deduction("single", 60_000, itemized)
+    # SALT is capped at 10,000
+    assert result == {"deduction_type": "itemized", "deduction_amount": 18_000}
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+import depreciation
+from depreciation import (
+    MACRS_GDS_HALF_YEAR,
+    PARALLEL_MIN_ASSETS,
+    AssetPool,
+    DepreciableAsset,
+    depreciate_asset,
+    depreciate_pool,
+)
+
+# -----------------------------------
+# Test Data
+# -----------------------------------
+
+TAX_CONFIG = {"bonus_rate": 0.6, "state_bonus_rate": 0.0}
+
+def _assets(n):
+    """
+    A mix of MACRS and ADS assets, with and without Section 179 elections.
+    """
+    rng = np.random.default_rng(0)
+    periods = sorted(MACRS_GDS_HALF_YEAR)
+    assets = []
+    for i in range(n):
+        cost = round(float(rng.uniform(100, 2_000_000)), 2)
+        assets.append(DepreciableAsset(
+            cost=cost,
+            recovery_period=periods[i % len(periods)] if i % 5 else int(rng.integers(1, 40)),
+            placed_in_service_qtr=int(rng.integers(1, 5)),
+            section179=round(cost * float(rng.uniform(0, 1.2)), 2) if i % 3 == 0 else 0.0,
+            use_ads=i % 5 == 0,
+        ))
+    return assets
+
+POOL = AssetPool(_assets(4 * PARALLEL_MIN_ASSETS))
+
+@pytest.fixture
+def serial(monkeypatch):
+    """
+    depreciate_pool forced onto the per-asset serial loop.
+    """
+    def run(pool, tax_config):
+        monkeypatch.setattr(depreciation, "PARALLEL_MIN_ASSETS", len(pool.assets) + 1)
+        try:
+            return depreciate_pool(pool, tax_config)
+        finally:
+            monkeypatch.undo()
+    return run
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+@pytest.mark.parametrize("tax_config", [
+    TAX_CONFIG,
+    {"bonus_rate": 1.0, "state_bonus_rate": 0.25},
+    {"bonus_rate": 0.0},
+])
+def test_parallel_pool_matches_serial(serial, tax_config):
+    assert len(POOL.assets) >= PARALLEL_MIN_ASSETS
+    assert depreciate_pool(POOL, tax_config) == serial(POOL, tax_config)
+
+def test_parallel_pool_matches_depreciate_asset():
+    results = depreciate_pool(POOL, TAX_CONFIG)
+    assert results["federal"] == [
+        depreciate_asset(asset, TAX_CONFIG["bonus_rate"]) for asset in POOL.assets
+    ]
+    assert results["state"] == [depreciate_asset(asset, 0.0) for asset in POOL.assets]
+
+@pytest.mark.parametrize("bad_asset, error", [
+    (DepreciableAsset(cost=1_000, recovery_period=4, placed_in_service_qtr=1), KeyError),
+    (DepreciableAsset(cost=1_000, recovery_period=0, placed_in_service_qtr=1, use_ads=True),
+     ZeroDivisionError),
+])
+def test_parallel_pool_rejects_bad_periods_like_serial(serial, bad_asset, error):
+    pool = AssetPool(list(POOL.assets) + [bad_asset])
+    with pytest.raises(error):
+        serial(pool, TAX_CONFIG)
+    with pytest.raises(error):
+        depreciate_pool(pool, TAX_CONFIG)
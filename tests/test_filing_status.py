@@ -0,0 +1,45 @@
+import pytest
+
+from credits import CTC_PHASEOUT_THRESHOLDS, EITC_RULES, calculate_child_tax_credit
+from deductions import STANDARD_DEDUCTIONS, get_standard_deduction
+from filing_status import FILING_STATUS_NAMES, FilingStatus, to_filing_status
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+def test_names_follow_enum_order():
+    assert FILING_STATUS_NAMES == tuple(status.name.lower() for status in FilingStatus)
+
+@pytest.mark.parametrize("status", list(FilingStatus))
+def test_names_and_members_round_trip(status):
+    name = FILING_STATUS_NAMES[status]
+    assert to_filing_status(name) is status
+    assert to_filing_status(name.upper()) is status
+    assert to_filing_status(status) is status
+
+def test_unknown_status_raises_with_lowercased_name():
+    with pytest.raises(ValueError, match="Invalid filing status: widowed"):
+        to_filing_status("WIDOWED")
+
+@pytest.mark.parametrize("name", list(STANDARD_DEDUCTIONS))
+def test_indexed_tables_match_the_named_dicts(name):
+    status = to_filing_status(name)
+    assert get_standard_deduction(status) == STANDARD_DEDUCTIONS[name]
+
+    # One child, just past the phase-out threshold: $50 off per $1,000 over
+    threshold = CTC_PHASEOUT_THRESHOLDS[name]
+    ctc = calculate_child_tax_credit(status, threshold + 1_000, 1)
+    assert ctc["total"] == 1950
+
+@pytest.mark.parametrize("table,key", [
+    (STANDARD_DEDUCTIONS, "single"),
+    (CTC_PHASEOUT_THRESHOLDS, "single"),
+    (EITC_RULES, 0),
+])
+def test_source_tables_are_read_only(table, key):
+    # The indexed tables are built from these at import, so edits would be ignored
+    with pytest.raises(TypeError):
+        table[key] = table[key]
+    with pytest.raises(TypeError):
+        del table[key]
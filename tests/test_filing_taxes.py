@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+
+from deductions import ItemizedDeductions, calculate_itemized_deductions
+from filing_status import FilingStatus
+from filing_taxes import file_taxes, file_taxes_batch, validate_filing_status
+
+# -----------------------------------
+# Test Data
+# -----------------------------------
+
+ITEMIZED = ItemizedDeductions(
+    medical_expenses=12_000,
+    state_local_taxes=14_000,
+    mortgage_interest=9_000,
+    charitable_contributions=2_500,
+)
+
+def _returns():
+    """
+    (status, gross, earned, children, itemized) covering every status,
+    zero income, bracket edges, CTC phase-out and both deduction choices.
+    """
+    rng = np.random.default_rng(0)
+    rows = []
+    for status in FilingStatus:
+        for gross in (0, 9_999.99, 10_000, 25_000, 40_000, 80_000, 123_456.78, 450_000):
+            for children in (0, 1, 3, 5):
+                for itemized in (None, ITEMIZED):
+                    rows.append((status, gross, gross, children, itemized))
+    for _ in range(500):
+        gross = round(float(rng.uniform(0, 600_000)), 2)
+        earned = round(gross * float(rng.uniform(0, 1)), 2)
+        rows.append((
+            FilingStatus(int(rng.integers(len(FilingStatus)))),
+            gross,
+            earned,
+            int(rng.integers(0, 5)),
+            ITEMIZED if rng.random() < 0.5 else None,
+        ))
+    return rows
+
+RETURNS = _returns()
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+@pytest.mark.parametrize("status", list(FilingStatus))
+def test_validate_filing_status_returns_canonical_name(status):
+    name = status.name.lower()
+    assert validate_filing_status(name) == name
+    assert validate_filing_status(name.title()) == name
+    assert validate_filing_status(status) == name
+
+def test_validate_filing_status_is_cached_and_never_caches_errors():
+    validate_filing_status.cache_clear()
+    validate_filing_status("single")
+    validate_filing_status("single")
+    info = validate_filing_status.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid filing status: joint"):
+            validate_filing_status("JOINT")
+
+@pytest.mark.parametrize("itemized,expected_type,expected_amount", [
+    (None, "standard", 13_850),
+    # 7.5% of 50,000 AGI is 3,750, so 17,600 of medical is 13,850 allowable:
+    # a tie keeps the standard deduction
+    (ItemizedDeductions(medical_expenses=17_600), "standard", 13_850),
+    (ItemizedDeductions(medical_expenses=17_600.01), "itemized", 13_850.01),
+    (ItemizedDeductions(mortgage_interest=5_000), "standard", 13_850),
+], ids=["none", "tie", "itemized_larger", "itemized_smaller"])
+def test_file_taxes_deduction_choice(itemized, expected_type, expected_amount):
+    summary = file_taxes(
+        filing_status="single",
+        gross_income=50_000,
+        earned_income=50_000,
+        itemized_deductions=itemized,
+    )
+    assert summary["deduction_type"] == expected_type
+    assert summary["deduction_used"] == expected_amount
+    assert summary["taxable_income"] == round(50_000 - expected_amount, 2)
+
+@pytest.mark.parametrize("gross,children,base_tax,tax_due,refund", [
+    # No credits: the base tax is due in full
+    (100_000, 0, 21_460.0, 21_460.0, 0.0),
+    # 800 nonrefundable + 3,200 refundable CTC, both fully absorbed
+    (100_000, 2, 21_460.0, 17_460.0, 0.0),
+    # 1,200 nonrefundable CTC is capped at the 615 base tax; the 4,800
+    # refundable CTC and 7,430 EITC carry the rest into a refund
+    (20_000, 3, 615.0, 0.0, 12_230.0),
+], ids=["no_credits", "credits_absorbed", "refund"])
+def test_file_taxes_credit_and_refund_rules(gross, children, base_tax, tax_due, refund):
+    summary = file_taxes(
+        filing_status="single",
+        gross_income=gross,
+        earned_income=gross,
+        qualifying_children=children,
+    )
+    assert summary["base_tax"] == base_tax
+    assert (summary["tax_due"], summary["refund"]) == (tax_due, refund)
+
+def test_batch_matches_scalar_file_taxes():
+    scalar = [
+        file_taxes(
+            filing_status=status.name.lower(),
+            gross_income=gross,
+            earned_income=earned,
+            qualifying_children=children,
+            itemized_deductions=itemized,
+        )
+        for status, gross, earned, children, itemized in RETURNS
+    ]
+    batch = file_taxes_batch(
+        filing_statuses=[status for status, *_ in RETURNS],
+        gross_income=[gross for _, gross, *_ in RETURNS],
+        earned_income=[earned for _, _, earned, *_ in RETURNS],
+        qualifying_children=[children for *_, children, _ in RETURNS],
+        itemized_totals=[
+            calculate_itemized_deductions(itemized, gross) if itemized else 0.0
+            for _, gross, _, _, itemized in RETURNS
+        ],
+    )
+
+    def column(key):
+        return np.array([row[key] for row in scalar])
+
+    np.testing.assert_array_equal(batch["standard_deduction"], column("standard_deduction"))
+    np.testing.assert_array_equal(batch["itemized"], column("deduction_type") == "itemized")
+    np.testing.assert_allclose(batch["deduction_used"], column("deduction_used"), rtol=0, atol=0.005)
+    np.testing.assert_allclose(batch["taxable_income"], column("taxable_income"), rtol=0, atol=0.005)
+
+    # The batch path rounds with np.round (half to even), so allow a cent
+    for key in ("base_tax", "tax_due", "refund"):
+        np.testing.assert_allclose(batch[key], column(key), rtol=0, atol=0.011, err_msg=key)
+    np.testing.assert_allclose(
+        batch["credits"]["total_credits"],
+        [row["credits"]["total_credits"] for row in scalar],
+        rtol=0,
+        atol=0.011,
+    )
+
+def test_batch_rejects_invalid_status_code():
+    with pytest.raises(ValueError, match="Invalid filing status code"):
+        file_taxes_batch(
+            filing_statuses=[len(FilingStatus)],
+            gross_income=[50_000],
+            earned_income=[50_000],
+            qualifying_children=[0],
+        )
+
+def test_batch_rejects_negative_income():
+    with pytest.raises(ValueError, match="cannot be negative"):
+        file_taxes_batch(
+            filing_statuses=[FilingStatus.SINGLE],
+            gross_income=[-1.0],
+            earned_income=[0.0],
+            qualifying_children=[0],
+        )
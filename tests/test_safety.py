@@ -19,6 +19,23 @@ HIGH_RISK_DEDUCTION_PAYLOAD = {
     "credits": 0
 }
 
+INVALID_DEDUCTION_PAYLOAD = {
+    "tax_year": 2024,
+    "filing_status": "single",
+    "incomes": [{"source": "salary", "amount": 50000}],
+    "itemized_deductions": [{"name": "Invalid Deduction", "amount": 10000}],
+    "credits": 0
+}
+
+# Deduction > 50% of income
+THRESHOLD_DEDUCTION_PAYLOAD = {
+    "tax_year": 2024,
+    "filing_status": "single",
+    "incomes": [{"source": "salary", "amount": 40000}],
+    "itemized_deductions": [{"name": "Suspicious Deduction", "amount": 30000}],
+    "credits": 0
+}
+
 UNCERTAIN_CASE_PAYLOAD = {
     "tax_year": 2024,
     "filing_status": "single",
@@ -32,32 +49,20 @@ UNCERTAIN_CASE_PAYLOAD = {
 # Tests
 # -----------------------------------
 
-def test_safe_advice_passes():
+@pytest.mark.parametrize("question,context,expected_flags", [
+    (SAFE_QUESTION, {"income": 85000},
+     {"unsafe_advice": False, "high_risk_deduction": False, "needs_review": False}),
+    (UNSAFE_QUESTION, {"income": 100000},
+     {"unsafe_advice": True, "needs_review": True}),
+], ids=["safe_advice", "unsafe_advice"])
+def test_reasoning_advice_flags(question, context, expected_flags):
     """
-    Confirm that a normal tax question does not trigger flags.
+    A normal tax question triggers no flags; clearly unsafe advice is flagged.
     """
-    result = run_reasoning_engine(SAFE_QUESTION, {"income": 85000})
+    result = run_reasoning_engine(question, context)
     flags = safety_check(result)
-    assert flags["unsafe_advice"] is False
-    assert flags["high_risk_deduction"] is False
-    assert flags["needs_review"] is False
-
-def test_unsafe_advice_detected():
-    """
-    AI should flag clearly unsafe tax advice.
-    """
-    result = run_reasoning_engine(UNSAFE_QUESTION, {"income": 100000})
-    flags = safety_check(result)
-    assert flags["unsafe_advice"] is True
-    assert flags["needs_review"] is True
-
-def test_high_risk_deduction_flagged():
-    """
-    Very large or unusual deductions should be flagged for review.
-    """
-    flags = safety_check(HIGH_RISK_DEDUCTION_PAYLOAD)
-    assert flags["high_risk_deduction"] is True
-    assert flags["needs_review"] is True
+    for flag, expected in expected_flags.items():
+        assert flags[flag] is expected
 
 def test_uncertain_cases_flagged_for_review():
     """
@@ -79,33 +84,18 @@ def test_review_notes_provided():
     assert isinstance(flags["review_notes"], str)
     assert len(flags["review_notes"]) > 0
 
-def test_obeys_irs_rules():
+@pytest.mark.parametrize("payload,expected_flags", [
+    # Very large or unusual deductions should be flagged for review
+    (HIGH_RISK_DEDUCTION_PAYLOAD, {"high_risk_deduction": True, "needs_review": True}),
+    # Thresholds (e.g., deduction > 50% of income) trigger flags
+    (THRESHOLD_DEDUCTION_PAYLOAD, {"high_risk_deduction": True, "needs_review": True}),
+    # Never encourage noncompliance with IRS rules for deductions, credits, etc.
+    (INVALID_DEDUCTION_PAYLOAD, {"unsafe_advice": True, "needs_review": True}),
+], ids=["high_risk_deduction", "flagging_threshold", "obeys_irs_rules"])
+def test_payload_flags(payload, expected_flags):
     """
-    Confirm that AI-generated reasoning never encourages noncompliance
-    with IRS rules for standard deductions, credits, etc.
+    Confirm that risky payloads raise the expected flags.
     """
-    payload = {
-        "tax_year": 2024,
-        "filing_status": "single",
-        "incomes": [{"source": "salary", "amount": 50000}],
-        "itemized_deductions": [{"name": "Invalid Deduction", "amount": 10000}],
-        "credits": 0
-    }
     flags = safety_check(payload)
-    assert flags["unsafe_advice"] is True
-    assert flags["needs_review"] is True
-
-def test_flagging_thresholds_work():
-    """
-    Confirm that thresholds (e.g., deduction > 50% of income) trigger flags
-    """
-    payload = {
-        "tax_year": 2024,
-        "filing_status": "single",
-        "incomes": [{"source": "salary", "amount": 40000}],
-        "itemized_deductions": [{"name": "Suspicious Deduction", "amount": 30000}],
-        "credits": 0
-    }
-    flags = safety_check(payload)
-    assert flags["high_risk_deduction"] is True
-    assert flags["needs_review"] is True
+    for flag, expected in expected_flags.items():
+        assert flags[flag] is expected
@@ -0,0 +1,192 @@
+import random
+import re
+
+import pytest
+
+import safety_checks
+from safety_checks import (
+    ALLOWED_CONTEXT_PATTERNS,
+    PROHIBITED_PATTERNS,
+    REQUIRED_DISCLAIMER,
+    SANITIZE_REPLACEMENTS,
+    contains_allowed_context,
+    contains_prohibited_language,
+    safety_gate,
+    sanitize_response,
+)
+
+# -----------------------------------
+# Reference (re.IGNORECASE) behaviour
+# -----------------------------------
+
+def reference_search(patterns, text):
+    return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+
+def reference_sanitize(text):
+    sanitized = text
+    for pattern, replacement in SANITIZE_REPLACEMENTS.items():
+        sanitized = re.sub(pattern, replacement, sanitized, flags=re.IGNORECASE)
+
+    if REQUIRED_DISCLAIMER.lower() not in sanitized.lower():
+        sanitized += f"\n\n{REQUIRED_DISCLAIMER}"
+
+    return sanitized
+
+# -----------------------------------
+# Test Data
+# -----------------------------------
+
+TEXTS = [
+    "",
+    # Mixed case
+    "You SHOULD file early.",
+    "i ReCoMmEnD itemizing.",
+    "YOUR BEST OPTION is to wait.",
+    "For General Information only.",
+    "The IRS generally allows this.",
+    "the irs GENERALLY allows this.",
+    # At and inside word boundaries
+    "hack",
+    "hack.",
+    "(hack)",
+    "shack",
+    "hackathon",
+    "hack_",
+    "_hack",
+    "hack1",
+    "offshore-based accounts",
+    "yourself and yours",
+    "you shouldn't",
+    "you  should",
+    "you\nshould",
+    "file as head of household",
+    "profile as shown",
+    # Overlapping and repeated matches
+    "shack hack",
+    "hackhack hack",
+    "you you should",
+    "you should your best option",
+    "I recommend your yourself your",
+    "to reduce your taxes, you should claim this deduction",
+    "your your your",
+    # Non-ASCII
+    "Café owners: you should keep receipts.",
+    "naïve hack",
+    "hac\u212a attempts",  # KELVIN SIGN folds to k under re.IGNORECASE
+    "you \u017fhould",     # LATIN SMALL LETTER LONG S folds to s
+    "Ýour return",
+    "évasion fiscale",
+    "your résumé",
+    "\uff39\uff2f\uff35 \uff33\uff28\uff2f\uff35\uff2c\uff24",
+    # Already carries the disclaimer
+    f"You should ask. {REQUIRED_DISCLAIMER}",
+    f"you should ask. {REQUIRED_DISCLAIMER.upper()}",
+]
+
+_FRAGMENTS = [
+    "you", "You", "YOUR", "your", "should", "SHOULD", "I", "recommend",
+    "hack", "shack", "file", "as", "Offshore", "evasion", "general",
+    "information", "the", "tax", "code", "provides", "é", "K", "_",
+    "-", ".", ",", " ", " ", " ", "\n",
+]
+
+def _random_texts(count=500):
+    rng = random.Random(0)
+    return [
+        "".join(rng.choice(_FRAGMENTS) for _ in range(rng.randint(1, 20)))
+        for _ in range(count)
+    ]
+
+ALL_TEXTS = TEXTS + _random_texts()
+
+@pytest.fixture
+def gate_cache():
+    """
+    An empty safety_gate cache; the returned callable gives (hits, misses, size).
+    """
+    safety_checks._cached_safety_gate.cache_clear()
+
+    def stats():
+        info = safety_gate.cache_info()
+        return info.hits, info.misses, info.currsize
+
+    return stats
+
+@pytest.fixture(params=["automaton", "regex"])
+def matchers(request, monkeypatch):
+    """
+    Prohibited/allowed matchers with and without pyahocorasick.
+    """
+    if request.param == "regex":
+        monkeypatch.setattr(safety_checks, "ahocorasick", None)
+    elif safety_checks.ahocorasick is None:
+        pytest.skip("pyahocorasick is not installed")
+
+    return (
+        safety_checks._PhraseMatcher(PROHIBITED_PATTERNS),
+        safety_checks._PhraseMatcher(ALLOWED_CONTEXT_PATTERNS),
+    )
+
+# -----------------------------------
+# Tests
+# -----------------------------------
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_detection_matches_ignorecase_regex(text):
+    assert contains_prohibited_language(text) == reference_search(PROHIBITED_PATTERNS, text)
+    assert contains_allowed_context(text) == reference_search(ALLOWED_CONTEXT_PATTERNS, text)
+
+def test_matchers_agree_with_regex_on_random_text(matchers):
+    prohibited, allowed = matchers
+    for text in ALL_TEXTS:
+        assert prohibited.search(text) == reference_search(PROHIBITED_PATTERNS, text), text
+        assert allowed.search(text) == reference_search(ALLOWED_CONTEXT_PATTERNS, text), text
+
+def test_matcher_keeps_non_literal_patterns_as_regex(matchers):
+    patterns = [r"\bform\s+1040\b", r"\bhack\b", r"\bI recommend\b"]
+    matcher = safety_checks._PhraseMatcher(patterns)
+    for text in ["See FORM   1040.", "form1040", "Shack", "i recommend", "Form 1040-SR"]:
+        assert matcher.search(text) == reference_search(patterns, text), text
+
+@pytest.mark.parametrize("text", TEXTS)
+def test_sanitize_matches_ignorecase_regex_exactly(text):
+    assert sanitize_response(text) == reference_sanitize(text)
+
+def test_sanitize_matches_on_random_text():
+    for text in ALL_TEXTS:
+        assert sanitize_response(text) == reference_sanitize(text), text
+
+def test_sanitize_keeps_original_casing_outside_matches():
+    assert sanitize_response("Dear CLIENT, YOU SHOULD File.").startswith(
+        "Dear CLIENT, one common approach is File."
+    )
+
+def test_gate_caches_per_response_and_jurisdiction(gate_cache):
+    response = "The IRS generally allows this."
+    first = safety_gate(response, {"jurisdiction": "US", "notes": ["a"]})
+    second = safety_gate(response, {"jurisdiction": "US", "notes": ["b"], "year": 2024})
+    default = safety_gate(response)
+
+    assert first == second == default
+    assert first.allowed
+    assert gate_cache() == (2, 1, 1)
+
+    blocked = safety_gate(response, {"jurisdiction": "CA"})
+    assert not blocked.allowed
+    assert blocked.reason == "Unsupported tax jurisdiction."
+    assert gate_cache() == (2, 2, 2)
+
+@pytest.mark.parametrize("key", sorted(safety_checks._PERSONAL_KEYS))
+def test_gate_never_caches_personalized_contexts(gate_cache, key):
+    result = safety_gate("General information.", {key: "123-45-6789"})
+    assert not result.allowed
+    assert result.reason == "Personalized tax advice is not permitted."
+    assert gate_cache() == (0, 0, 0)
+
+def test_gate_unhashable_jurisdiction_bypasses_cache(gate_cache):
+    context = {"jurisdiction": ["US"]}
+    with pytest.raises(TypeError):
+        safety_checks._evaluate_safety_gate("General information.", context)
+    with pytest.raises(TypeError):
+        safety_gate("General information.", context)
+    assert gate_cache() == (0, 0, 0)
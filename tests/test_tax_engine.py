@@ -1,144 +1,163 @@
+from dataclasses import asdict, dataclass, replace
+from typing import Tuple
+
+import numpy as np
 import pytest
-from fastapi.testclient import TestClient
-from tax_api import app, STANDARD_DEDUCTION_2024, FEDERAL_TAX_BRACKETS_2024
+from tax_api import MAX_BATCH_SIZE, STANDARD_DEDUCTION_2024, FEDERAL_TAX_BRACKETS_2024
+
+# Reference bracket math lives in _tax_reference.py
+from _tax_reference import calc_tax, calculate_expected_tax
 
-client = TestClient(app)
+# tax_client and async_tax_client are session-scoped fixtures in conftest.py
 
 # -----------------------------
-# Helper functions
+# Test Data
 # -----------------------------
 
-def calculate_expected_tax(taxable_income, brackets):
+@dataclass(slots=True, frozen=True)
+class Income:
+    source: str
+    amount: float
+
+@dataclass(slots=True, frozen=True)
+class Deduction:
+    name: str
+    amount: float
+
+@dataclass(slots=True, frozen=True)
+class TaxPayload:
     """
-    Deterministic progressive tax calculation for testing
+    Immutable /tax/calculate request; derive variants with dataclasses.replace.
     """
-    remaining_income = taxable_income
-    tax = 0
-    for i, (start, rate) in enumerate(brackets):
-        end = brackets[i + 1][0] if i + 1 < len(brackets) else None
-        taxable_at_rate = remaining_income
-        if end:
-            taxable_at_rate = min(remaining_income, end - start)
-        tax += taxable_at_rate * rate
-        remaining_income -= taxable_at_rate
-        if remaining_income <= 0:
-            break
-    return round(tax, 2)
+    tax_year: int = 2024
+    filing_status: str = "single"
+    incomes: Tuple[Income, ...] = ()
+    itemized_deductions: Tuple[Deduction, ...] = ()
+    dependents: int = 0
+    credits: float = 0.0
 
-# -----------------------------
-# Test Data
-# -----------------------------
+BASE = TaxPayload(incomes=(Income("salary", 85000),))
+BASE_JSON = asdict(BASE)
 
-BASE_PAYLOAD = {
-    "tax_year": 2024,
-    "filing_status": "single",
-    "incomes": [{"source": "salary", "amount": 85000}],
-    "itemized_deductions": [],
-    "dependents": 0,
-    "credits": 0.0
+def as_json(payload):
+    """
+    Request body for a payload; the unchanged BASE is serialized only once.
+    """
+    return BASE_JSON if payload is BASE else asdict(payload)
+
+# Every scenario below is calculated in one /tax/calculate/batch request
+PAYLOADS = {
+    "single": BASE,
+    "married_joint": replace(BASE, filing_status="married_joint"),
+    "itemized": replace(BASE, itemized_deductions=(Deduction("Mortgage Interest", 20000),)),
+    "credits": replace(BASE, credits=1000.0),
+    "zero_income": replace(BASE, incomes=(Income("none", 0),)),
+    "negative_income": replace(BASE, incomes=(Income("loss", -5000),)),
+    "high_deductions": replace(
+        BASE,
+        incomes=(Income("salary", 50000),),
+        itemized_deductions=(Deduction("Huge Donation", 40000),),
+    ),
+    # Simplified demo: treat capital expenses as itemized deductions
+    "capital_expenses": replace(BASE, itemized_deductions=(
+        Deduction("Depreciation Expense", 10000),
+        Deduction("Office Equipment", 5000),
+    )),
 }
 
+@pytest.fixture(scope="module")
+def results(tax_client):
+    response = tax_client.post(
+        "/tax/calculate/batch",
+        json=[as_json(payload) for payload in PAYLOADS.values()],
+    )
+    assert response.status_code == 200
+    return dict(zip(PAYLOADS, response.json()))
+
 # -----------------------------
 # Tests
 # -----------------------------
 
-def test_standard_deduction_applied():
-    payload = BASE_PAYLOAD.copy()
-    # No itemized deductions → should use standard
-    response = client.post("/tax/calculate", json=payload)
+@pytest.mark.parametrize("name", list(PAYLOADS))
+def test_batch_matches_single_request(tax_client, results, name):
+    response = tax_client.post("/tax/calculate", json=as_json(PAYLOADS[name]))
     assert response.status_code == 200
-    data = response.json()
-    assert data["deduction_used"] == STANDARD_DEDUCTION_2024["single"]
+    assert response.json() == results[name]
+
+def test_batch_rejects_more_than_max_size(tax_client):
+    response = tax_client.post(
+        "/tax/calculate/batch", json=[BASE_JSON] * (MAX_BATCH_SIZE + 1)
+    )
+    assert response.status_code == 422
+
+def test_batch_rejects_unsupported_status_up_front(tax_client):
+    payloads = [BASE, replace(BASE, filing_status="head_of_household"), BASE]
+    response = tax_client.post(
+        "/tax/calculate/batch", json=[as_json(payload) for payload in payloads]
+    )
+    assert response.status_code == 422
+    assert "[1]" in response.json()["detail"]
+
+@pytest.mark.parametrize("status", ["single", "married_joint"])
+def test_standard_deduction_applied(results, status):
+    # No itemized deductions → should use standard
+    data = results[status]
+    assert data["deduction_used"] == STANDARD_DEDUCTION_2024[status]
 
-def test_itemized_deduction_used_when_higher():
-    payload = BASE_PAYLOAD.copy()
-    payload["itemized_deductions"] = [{"name": "Mortgage Interest", "amount": 20000}]
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+def test_itemized_deduction_used_when_higher(results):
+    data = results["itemized"]
     # Should use itemized since 20k > 14,600
     assert data["deduction_used"] == 20000
 
-def test_taxable_income_calculation():
-    payload = BASE_PAYLOAD.copy()
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
-    expected_taxable = payload["incomes"][0]["amount"] - STANDARD_DEDUCTION_2024["single"]
+def test_taxable_income_calculation(results):
+    data = results["single"]
+    expected_taxable = BASE.incomes[0].amount - STANDARD_DEDUCTION_2024["single"]
     assert data["taxable_income"] == expected_taxable
 
-def test_progressive_tax_brackets():
-    payload = BASE_PAYLOAD.copy()
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+def test_progressive_tax_brackets(results):
+    data = results["single"]
     taxable_income = data["taxable_income"]
     expected_tax = calculate_expected_tax(taxable_income, FEDERAL_TAX_BRACKETS_2024["single"])
     assert data["total_tax_before_credits"] == expected_tax
 
-def test_credits_applied_correctly():
-    payload = BASE_PAYLOAD.copy()
-    payload["credits"] = 1000.0
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+def test_credits_applied_correctly(results):
+    data = results["credits"]
     assert data["credits_applied"] == 1000.0
     assert data["total_tax_liability"] == data["total_tax_before_credits"] - 1000.0
 
-def test_filing_status_variation():
-    payload = BASE_PAYLOAD.copy()
-    payload["filing_status"] = "married_joint"
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
-    assert data["deduction_used"] == STANDARD_DEDUCTION_2024["married_joint"]
-
-def test_zero_income_edge_case():
-    payload = BASE_PAYLOAD.copy()
-    payload["incomes"] = [{"source": "none", "amount": 0}]
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+def test_zero_income_edge_case(results):
+    data = results["zero_income"]
     assert data["taxable_income"] == 0
     assert data["total_tax_liability"] == 0
 
-def test_negative_income_edge_case():
-    payload = BASE_PAYLOAD.copy()
-    payload["incomes"] = [{"source": "loss", "amount": -5000}]
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+def test_negative_income_edge_case(results):
+    data = results["negative_income"]
     # Negative income → taxable income 0
     assert data["taxable_income"] == 0
     assert data["total_tax_liability"] == 0
 
-def test_business_rule_high_deductions_trigger_warning():
+def test_business_rule_high_deductions_trigger_warning(results):
     # Simulate "audit rule" for very high deductions relative to income
-    payload = BASE_PAYLOAD.copy()
-    payload["incomes"] = [{"source": "salary", "amount": 50000}]
-    payload["itemized_deductions"] = [{"name": "Huge Donation", "amount": 40000}]
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+    data = results["high_deductions"]
     # Deduction should still be applied correctly
     assert data["deduction_used"] == 40000
     assert data["taxable_income"] == 10000
     # Could also log an "audit flag" if implemented
 
-def test_depreciation_and_capital_expenses():
-    # Simplified demo: treat capital expenses as itemized deductions
-    payload = BASE_PAYLOAD.copy()
-    payload["itemized_deductions"] = [
-        {"name": "Depreciation Expense", "amount": 10000},
-        {"name": "Office Equipment", "amount": 5000}
-    ]
-    response = client.post("/tax/calculate", json=payload)
-    data = response.json()
+def test_depreciation_and_capital_expenses(results):
+    data = results["capital_expenses"]
     # Deduction = sum of itemized
     assert data["deduction_used"] == 15000
 
-def test_end_to_end_tax_engine_calculation():
-    payload = {
-        "tax_year": 2024,
-        "filing_status": "head_of_household",
-        "incomes": [{"source": "salary", "amount": 120000}],
-        "itemized_deductions": [{"name": "Mortgage", "amount": 25000}],
-        "dependents": 2,
-        "credits": 2000
-    }
-    response = client.post("/tax/calculate", json=payload)
+def test_end_to_end_tax_engine_calculation(tax_client):
+    payload = TaxPayload(
+        filing_status="head_of_household",
+        incomes=(Income("salary", 120000),),
+        itemized_deductions=(Deduction("Mortgage", 25000),),
+        dependents=2,
+        credits=2000,
+    )
+    response = tax_client.post("/tax/calculate", json=as_json(payload))
     data = response.json()
     assert data["gross_income"] == 120000
     # Deduction should use itemized 25k vs standard 21,900 → 25k
@@ -147,3 +166,35 @@ def test_end_to_end_tax_engine_calculation():
     assert data["credits_applied"] == 2000
     assert data["total_tax_liability"] == data["total_tax_before_credits"] - 2000
     assert len(data["bracket_breakdown"]) > 0
+
+@pytest.mark.asyncio(loop_scope="session")
+@pytest.mark.parametrize("status", ["single", "married_joint"])
+async def test_progressive_tax_sweep(async_tax_client, status):
+    brackets = FEDERAL_TAX_BRACKETS_2024[status]
+    starts = np.array([start for start, _ in brackets], dtype=np.float64)
+    rates = np.array([rate for _, rate in brackets], dtype=np.float64)
+
+    # Whole-dollar incomes on and between every bracket edge
+    taxable = np.unique(np.concatenate([
+        np.arange(0, 800_000, 12_500, dtype=np.float64),
+        starts,
+        starts + 1,
+    ]))
+    payloads = [
+        replace(BASE, filing_status=status, incomes=(Income("salary", income + STANDARD_DEDUCTION_2024[status]),))
+        for income in taxable.tolist()
+    ]
+    response = await async_tax_client.post(
+        "/tax/calculate/batch", json=[as_json(payload) for payload in payloads]
+    )
+    assert response.status_code == 200
+    data = response.json()
+
+    np.testing.assert_array_equal([d["taxable_income"] for d in data], taxable)
+    # The API rounds each bracket's tax, so allow a cent per bracket
+    np.testing.assert_allclose(
+        [d["total_tax_before_credits"] for d in data],
+        calc_tax(taxable, starts, rates),
+        rtol=0,
+        atol=0.01 * len(brackets),
+    )